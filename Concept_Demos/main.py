@@ -1,15 +1,97 @@
 import argparse
+import itertools
 import os
+import sys
+import time
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Optional
 # 
 import src.mcp.config
 from src.mcp.orchestrator import Orchestrator
 from src.utils.helpers import logger
-from src.utils.run_logger import init_run_logger
+from src.utils.run_logger import RunLogger, init_run_logger
 
+# Created on first use so query-only invocations never touch the log DB.
+_run_logger: Optional[RunLogger] = None
+
+
+def get_run_logger() -> RunLogger:
+    """Return the run logger for this invocation, initializing it on first call."""
+    global _run_logger
+    if _run_logger is None:
+        _run_logger = init_run_logger(log_dir="logs", db_path="data/run_logs.db")
+    return _run_logger
+
+
+# CLI-friendly agent aliases -> registered agent names
+_AGENT_ALIASES = MappingProxyType(
+    {
+        "artemis_agent": "Artemis Agent",
+        "research_agent": "Research Agent",
+        "summarizer_agent": "Summarizer Agent",
+    }
+)
+
+
+def _ts_id() -> str:
+    """Local-time YYYYMMDDHHMMSS stamp used in generated task IDs."""
+    return time.strftime("%Y%m%d%H%M%S")
+
+
+_EXAMPLE_FILENAME = "Example Research Task.md"
+_EXAMPLE_REL_PATH = os.path.join(
+    src.mcp.config.AGENT_INPUT_DIR, src.mcp.config.AGENT_OUTPUT_DIR, _EXAMPLE_FILENAME
+)
+
+# Only the task_id varies between example notes; the rest is built once at import.
+_EXAMPLE_TASK_NOTE_TEMPLATE = """---\ntask_id: {task_id}\nrequired_capability: web_search\nstatus: pending\ntags: ["example", "research"]\n---\n\n# Research Task: Artificial Intelligence Ethics\n\n## Context\n\nProvide an overview of the current ethical considerations surrounding the development and deployment of Artificial Intelligence. Focus on privacy, bias, and accountability.\n\nKeywords: AI ethics, privacy, bias, accountability, machine learning\nTarget: [[AI Concepts]]\nSource: Internet\n\n## Subtasks\n\n- [ ]  Research current debates on AI ethics\n- [ ]  Find examples of AI bias in real-world applications\n- [ ]  Summarize key regulations or frameworks proposed for AI accountability\n"""
+
+
+# Static fields of the Scenario 1 summarizer demo; only the log entry is per-run.
+_DIRECT_TASK_CONTEXT = {
+    "task_id": "direct_summary_T001",
+    "title": "Summarize provided text",
+    "content": "Large Language Models (LLMs) are a class of artificial intelligence models that are trained on vast amounts of text data. They are capable of understanding and generating human-like text, performing tasks such as translation, summarization, question-answering, and content creation. Their development has rapidly advanced in recent years, leading to significant breakthroughs in natural language processing and various applications across industries.",
+    "required_capability": "text_summarization",
+    "status": "pending",
+    "tags": ["demo", "summarization"],
+    "agent": "Summarizer Agent",
+    "metadata": {"source": "direct_demo", "demo": True},
+}
+
+_EXAMPLE_YAML_HELP = """---\ntask_id: T_NEW_RESEARCH\nrequired_capability: web_search\nstatus: pending\n---\n\n# New Topic for Research\n\nTopic: The future of renewable energy technologies\nContext: Research emerging trends and key players.\nKeywords: solar, wind, geothermal, fusion\n"""
+
+
+# Single-flag invocations answered without building the argparse parser.
+_FAST_PATH_FLAGS = MappingProxyType(
+    {"--show-hebbian": "show_hebbian", "--skip-demos": "skip_demos"}
+)
+
+
+def _default_cli_namespace() -> argparse.Namespace:
+    """Namespace matching parse_cli_args() defaults; keep in sync with the parser."""
+    return argparse.Namespace(
+        instruction=None,
+        capability="web_search",
+        agent=None,
+        title=None,
+        skip_demos=False,
+        show_hebbian=False,
+        agent_stats=None,
+    )
+
+
+def parse_cli_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        return _default_cli_namespace()
+    if len(argv) == 1 and argv[0] in _FAST_PATH_FLAGS:
+        args = _default_cli_namespace()
+        setattr(args, _FAST_PATH_FLAGS[argv[0]], True)
+        return args
 
-def parse_cli_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Run MCP and optionally send a one-off instruction to an agent.",
         allow_abbrev=True,
@@ -45,7 +127,7 @@ def parse_cli_args() -> argparse.Namespace:
     parser.add_argument(
         "--agent-stats", help="Show Hebbian statistics for a specific agent and exit."
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def setup_example_task_note(obs_manager: Any, memory_bus: Optional[Any] = None) -> None:
@@ -53,30 +135,31 @@ def setup_example_task_note(obs_manager: Any, memory_bus: Optional[Any] = None)
     Creates an example task note in the Obsidian Agent Inputs folder
     if one doesn't already exist, for demonstration purposes.
     """
-    example_filename = "Example Research Task.md"
-    relative_path = os.path.join(src.mcp.config.AGENT_INPUT_DIR, src.mcp.config.AGENT_OUTPUT_DIR, example_filename)
+    example_filename = _EXAMPLE_FILENAME
+    relative_path = _EXAMPLE_REL_PATH
     full_path = obs_manager._get_full_path(
         relative_path
     )  # Access internal for convenience
 
     if not full_path.is_file():
-        logger.info(f"Creating example task note at {relative_path}")
-        content = f"""---\ntask_id: {datetime.now().strftime('%Y%m%d%H%M%S')}\nrequired_capability: web_search\nstatus: pending\ntags: ["example", "research"]\n---\n\n# Research Task: Artificial Intelligence Ethics\n\n## Context\n\nProvide an overview of the current ethical considerations surrounding the development and deployment of Artificial Intelligence. Focus on privacy, bias, and accountability.\n\nKeywords: AI ethics, privacy, bias, accountability, machine learning\nTarget: [[AI Concepts]]\nSource: Internet\n\n## Subtasks\n\n- [ ]  Research current debates on AI ethics\n- [ ]  Find examples of AI bias in real-world applications\n- [ ]  Summarize key regulations or frameworks proposed for AI accountability\n"""
+        logger.info("Creating example task note at %s", relative_path)
+        content = _EXAMPLE_TASK_NOTE_TEMPLATE.format(task_id=_ts_id())
         if memory_bus:
             try:
                 memory_bus.write_note_with_embedding(
                     relative_path, content, metadata={"demo": True}, embed=True
                 )
             except Exception as exc:
-                logger.error(f"Failed to write example note via memory bus: {exc}")
+                logger.error("Failed to write example note via memory bus: %s", exc)
                 obs_manager.write_note(relative_path, content, overwrite=False)
         else:
             obs_manager.write_note(relative_path, content, overwrite=False)
         logger.info(
-            f"Example task note '{example_filename}' created. Please review it in your Obsidian vault."
+            "Example task note '%s' created. Please review it in your Obsidian vault.",
+            example_filename,
         )
     else:
-        logger.info(f"Example task note '{example_filename}' already exists.")
+        logger.info("Example task note '%s' already exists.", example_filename)
 
 
 def handle_user_instruction(
@@ -91,16 +174,9 @@ def handle_user_instruction(
         logger.info("No instruction text provided. Skipping direct agent dispatch.")
         return
 
-    # Agent name mapping for convenience
-    agent_name_map = {
-        "artemis_agent": "Artemis Agent",
-        "research_agent": "Research Agent",
-        "summarizer_agent": "Summarizer Agent",
-    }
-    if agent_name in agent_name_map:
-        agent_name = agent_name_map[agent_name]
+    agent_name = _AGENT_ALIASES.get(agent_name, agent_name)
 
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    timestamp = _ts_id()
     task_id = f"user_instruction_{timestamp}"
     task_title = title or instruction.strip().split("\n")[0][:80] or "User Instruction"
     agent_for_dispatch = None
@@ -109,7 +185,9 @@ def handle_user_instruction(
         agent_for_dispatch = orchestrator.agent_registry.get_agent(agent_name)
         if not agent_for_dispatch:
             logger.error(
-                f"Agent '{agent_name}' not registered. Available: {orchestrator.agent_registry.get_agent_names()}"
+                "Agent '%s' not registered. Available: %s",
+                agent_name,
+                orchestrator.agent_registry.get_agent_names(),
             )
             return
         derived_capability = (
@@ -120,7 +198,8 @@ def handle_user_instruction(
         if not effective_capability:
             if not derived_capability:
                 logger.error(
-                    f"Agent '{agent_name}' has no capabilities defined; cannot dispatch."
+                    "Agent '%s' has no capabilities defined; cannot dispatch.",
+                    agent_name,
                 )
                 return
             effective_capability = derived_capability
@@ -141,14 +220,16 @@ def handle_user_instruction(
         task_data["agent"] = agent_name
 
     logger.info(
-        f"\n--- User Instruction: Dispatching task with capability '{effective_capability}' ---"
+        "\n--- User Instruction: Dispatching task with capability '%s' ---",
+        effective_capability,
     )
     try:
-        note_path = orchestrator.create_new_task_in_obsidian(task_data)
-        orchestrator.update_task_status_in_obsidian(note_path, "in progress", task_id)
+        note_path = orchestrator.create_new_task_in_obsidian(
+            task_data, initial_status="in progress"
+        )
     except Exception as exc:
         logger.error(
-            f"Failed to record instruction in Obsidian before execution: {exc}"
+            "Failed to record instruction in Obsidian before execution: %s", exc
         )
         note_path = None  # Proceed without Obsidian tracking if note creation fails
 
@@ -157,14 +238,14 @@ def handle_user_instruction(
             orchestrator.assign_and_execute_task(
                 agent_for_dispatch.name, task_data, note_path
             )
-            logger.info(f"Instruction processed by agent '{agent_for_dispatch.name}'.")
+            logger.info("Instruction processed by agent '%s'.", agent_for_dispatch.name)
         else:
             orchestrator.route_and_execute_task(task_data, note_path)
             logger.info(
-                f"Instruction processed for capability '{effective_capability}'."
+                "Instruction processed for capability '%s'.", effective_capability
             )
     except Exception as exc:
-        logger.error(f"Error processing instruction: {exc}")
+        logger.error("Error processing instruction: %s", exc)
         if note_path:
             orchestrator.update_task_status_in_obsidian(note_path, "failed", task_id)
 
@@ -172,21 +253,19 @@ def handle_user_instruction(
 def main() -> None:
     args = parse_cli_args()
 
-    # Initialize run logger for comprehensive tracking
-    run_logger = init_run_logger(log_dir="logs", db_path="data/run_logs.db")
-
     logger.info("Starting Multi-Agent Coordination Platform...")
-    run_logger.log_event(
-        "mcp_init", "main", {"args": vars(args)}, "MCP initialization started"
-    )
 
-    if not os.path.exists(src.mcp.config.OBSIDIAN_VAULT_PATH or ""):
+    try:
+        os.stat(src.mcp.config.OBSIDIAN_VAULT_PATH or "")
+    except OSError:
         logger.error(
-            f"Error: Obsidian vault path '{src.mcp.config.OBSIDIAN_VAULT_PATH}' does not exist."
+            "Error: Obsidian vault path '%s' does not exist.",
+            src.mcp.config.OBSIDIAN_VAULT_PATH,
         )
         logger.error(
             "Set OBSIDIAN_VAULT_PATH in the project '.env' or export it in your shell to point to your vault."
         )
+        run_logger = get_run_logger()
         run_logger.log_event(
             "mcp_error",
             "main",
@@ -197,20 +276,6 @@ def main() -> None:
         return
 
     orchestrator = Orchestrator()
-    run_logger.log_event(
-        "orchestrator_ready",
-        "main",
-        {"agents": orchestrator.agent_registry.get_agent_names() 
-         if orchestrator.agent_registry else []},
-        "Orchestrator initialized",
-    )
-
-    # Agent name mapping for convenience
-    agent_name_map = {
-        "artemis_agent": "Artemis Agent",
-        "research_agent": "Research Agent",
-        "summarizer_agent": "Summarizer Agent",
-    }
 
     # Handle Hebbian statistics display
     if args.show_hebbian:
@@ -218,10 +283,30 @@ def main() -> None:
         return
 
     if args.agent_stats:
-        agent_name = agent_name_map.get(args.agent_stats, args.agent_stats)
+        agent_name = _AGENT_ALIASES.get(args.agent_stats, args.agent_stats)
         orchestrator.show_agent_hebbian_stats(agent_name or args.agent_stats)
         return
 
+    # Initialize run logger for comprehensive tracking
+    run_logger = get_run_logger()
+    if run_logger.enabled_for("mcp_init"):
+        run_logger.log_event(
+            "mcp_init", "main", {"args": vars(args)}, "MCP initialization started"
+        )
+    if run_logger.enabled_for("orchestrator_ready"):
+        run_logger.log_event(
+            "orchestrator_ready",
+            "main",
+            {
+                "agents": (
+                    orchestrator.agent_registry.get_agent_names()
+                    if orchestrator.agent_registry
+                    else []
+                )
+            },
+            "Orchestrator initialized",
+        )
+
     # --- Optional: Set up demo content and sample direct task ---
     if not args.skip_demos:
         setup_example_task_note(orchestrator.obs_manager, orchestrator.memory_bus)
@@ -229,24 +314,22 @@ def main() -> None:
         logger.info("\n--- MCP Operations ---")
         logger.info("\n--- Scenario 1: Direct Task Assignment (Summarizer Agent) ---")
         direct_task_context = {
-            "task_id": "direct_summary_T001",
-            "title": "Summarize provided text",
-            "content": "Large Language Models (LLMs) are a class of artificial intelligence models that are trained on vast amounts of text data. They are capable of understanding and generating human-like text, performing tasks such as translation, summarization, question-answering, and content creation. Their development has rapidly advanced in recent years, leading to significant breakthroughs in natural language processing and various applications across industries.",
-            "required_capability": "text_summarization",
-            "status": "pending",
-            "tags": ["demo", "summarization"],
-            "agent": "Summarizer Agent",
-            "metadata": {"source": "direct_demo", "demo": True},
-            "log": [    {"timestamp": datetime.now().isoformat(), "event": "Task created for direct instruction demo."}]    
+            **_DIRECT_TASK_CONTEXT,
+            "log": [
+                {
+                    "timestamp": datetime.now().isoformat(),
+                    "event": "Task created for direct instruction demo.",
                 }
+            ],
+        }
 
         try:
             orchestrator.route_and_execute_task(direct_task_context)
-            logger.info(f"Direct summary task completed. Report written to Obsidian.")
+            logger.info("Direct summary task completed. Report written to Obsidian.")
         except ValueError as ve:
-            logger.error(f"Value error during direct task assignment: {ve}")
+            logger.error("Value error during direct task assignment: %s", ve)
         except Exception as e:  
-            logger.error(f"Failed to assign direct task: {e}")
+            logger.error("Failed to assign direct task: %s", e)
     else:
         logger.info("Skipping demo note creation and static summarizer task.")
 
@@ -257,54 +340,63 @@ def main() -> None:
 
     # --- Scenario 2: Check for tasks from Obsidian ---
     logger.info("\n--- Scenario 2: Checking for new tasks in Obsidian ---")
-    new_tasks = orchestrator.check_for_new_tasks_from_obsidian()
+    task_iter = orchestrator.iter_new_tasks_from_obsidian()
+    first_task = next(task_iter, None)
+    tasks_found = tasks_failed = tasks_no_capability = 0
 
-    if new_tasks:
-        logger.info(f"Found {len(new_tasks)} new pending tasks in Obsidian.")
-        for original_note_path, task_data in new_tasks:
+    if first_task is not None:
+        logger.info(
+            "Found pending tasks in Obsidian; processing as they are discovered."
+        )
+        for original_note_path, task_data in itertools.chain([first_task], task_iter):
+            tasks_found += 1
             task_title = task_data.get("title", "Untitled Task")
             capability = task_data.get("required_capability")
-            setting = task_data.get("setting", {})
             if capability:
                 logger.info(
-                    f"Processing task '{task_title}' with capability '{capability}' from '{original_note_path}'"
-                )
-
-                # First, update task status to 'in progress' in Obsidian
-                orchestrator.update_task_status_in_obsidian(
-                    original_note_path, "in progress", task_data["task_id"]
+                    "Processing task '%s' with capability '%s' from '%s'",
+                    task_title,
+                    capability,
+                    original_note_path,
                 )
 
-                # Execute the task
-                try:
-                    orchestrator.route_and_execute_task(task_data, original_note_path)
-                    logger.info(f"Task '{task_title}' completed.")
-                except Exception as e:
-                    logger.error(f"Error processing task '{task_title}': {e}")
-                    orchestrator.update_task_status_in_obsidian(
-                        original_note_path, "failed", task_data["task_id"]
-                    )
+                # Status changes are buffered and written once when the task ends
+                with orchestrator.status_transaction(
+                    original_note_path, task_data["task_id"]
+                ) as txn:
+                    try:
+                        orchestrator.route_and_execute_task(
+                            task_data, original_note_path
+                        )
+                        logger.info("Task '%s' completed.", task_title)
+                    except Exception as e:
+                        logger.error("Error processing task '%s': %s", task_title, e)
+                        txn.fail()
+                if txn.status != "completed":
+                    tasks_failed += 1
             else:
                 logger.warning(
-                    f"Task '{task_title}' has no 'required_capability'. Skipping."
+                    "Task '%s' has no 'required_capability'. Skipping.", task_title
                 )
                 orchestrator.update_task_status_in_obsidian(
                     original_note_path, "no_capability", task_data["task_id"]
                 )
+                tasks_no_capability += 1
+        logger.info("Processed %d pending task(s) from Obsidian.", tasks_found)
     else:
         logger.info("No new pending tasks found in Obsidian input folder.")
         logger.info(
-            f"Remember to create a new Markdown note in '{src.mcp.config.OBSIDIAN_VAULT_PATH}/{src.mcp.config.AGENT_INPUT_DIR}' with 'status: pending' and 'required_capability' in its YAML frontmatter, for example:"
-        )
-        logger.info(
-            """---\ntask_id: T_NEW_RESEARCH\nrequired_capability: web_search\nstatus: pending\n---\n\n# New Topic for Research\n\nTopic: The future of renewable energy technologies\nContext: Research emerging trends and key players.\nKeywords: solar, wind, geothermal, fusion\n"""
+            "Remember to create a new Markdown note in '%s/%s' with 'status: pending' and 'required_capability' in its YAML frontmatter, for example:",
+            src.mcp.config.OBSIDIAN_VAULT_PATH,
+            src.mcp.config.AGENT_INPUT_DIR,
         )
+        logger.info(_EXAMPLE_YAML_HELP)
 
     # Finalize run logging with summary
     run_logger.finalize_run(
         status="completed",
         summary={
-            "tasks_found": len(new_tasks) if new_tasks else 0,
+            "tasks_found": tasks_found,
             "skip_demos": args.skip_demos,
             "instruction_provided": bool(args.instruction),
             "capability": args.capability,
@@ -314,9 +406,9 @@ def main() -> None:
             "demo_tasks_created": not args.skip_demos,
             "demo_summary_task": not args.skip_demos,
             "example_task_note": not args.skip_demos,
-            "new_tasks_processed": len(new_tasks) if new_tasks else 0,
-            "new_tasks_failed": sum(1 for _, task in new_tasks if task.get("status") == "failed") if new_tasks else 0,
-            "new_tasks_no_capability": sum(1 for _, task in new_tasks if task.get("status") == "no_capability") if new_tasks else 0,
+            "new_tasks_processed": tasks_found,
+            "new_tasks_failed": tasks_failed,
+            "new_tasks_no_capability": tasks_no_capability,
             "user_instruction": bool(args.instruction),
             "user_instruction_capability": args.capability if args.instruction else None,
             "user_instruction_agent": args.agent if args.instruction else None,
@@ -329,7 +421,7 @@ def main() -> None:
 
         },
     )
-    logger.info(f"Run log saved to: {run_logger.md_path}")
+    logger.info("Run log saved to: %s", run_logger.md_path)
 # --- End of main function ---
 if __name__ == "__main__":   
     main()
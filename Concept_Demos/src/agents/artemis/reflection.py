@@ -4,40 +4,109 @@
 narrative building from multiple conversation threads.
 """
 
+import heapq
 import re
+import sys
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from dataclasses import dataclass, field
+from itertools import islice
+from operator import attrgetter
 from typing import Dict, List, Optional, Set, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class ConceptNode:
     """Represents a concept extracted from conversations.
 
     Attributes:
         concept: The concept text
-        contexts: List of contexts where concept appeared
+        contexts: Conversation IDs (indexes into
+            ReflectionEngine.conversation_history) where the concept appeared
         related_concepts: Set of related concept names
         frequency: Number of times concept appeared
-        importance_score: Calculated importance (0-1)
+        importance_score: Calculated importance (0-1), updated as contexts
+            are added
     """
 
     concept: str
-    contexts: List[str] = field(default_factory=list)
+    contexts: List[int] = field(default_factory=list)
     related_concepts: Set[str] = field(default_factory=set)
     frequency: int = 0
     importance_score: float = 0.0
 
-    def add_context(self, context: str) -> None:
-        """Add a context where this concept appeared."""
-        self.contexts.append(context)
+    def add_context(self, doc_id: int) -> None:
+        """Record a conversation ID where this concept appeared."""
+        self.contexts.append(doc_id)
         self.frequency += 1
+        # Saturating score kept current here so ranking never needs a rescore pass
+        self.importance_score = self.frequency / (self.frequency + 1)
 
     def relate_to(self, other_concept: str) -> None:
         """Mark another concept as related."""
         self.related_concepts.add(other_concept)
 
 
-@dataclass
+STOPWORDS = frozenset(
+    sys.intern(word)
+    for word in (
+        "the",
+        "and",
+        "of",
+        "to",
+        "a",
+        "in",
+        "for",
+        "is",
+        "on",
+        "with",
+        "that",
+        "by",
+        "this",
+        "it",
+        "from",
+        "as",
+        "are",
+        "an",
+        "be",
+        "or",
+        "at",
+    )
+)
+
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9\s]")
+
+# Maximum number of characters between two concepts for them to be related.
+_PROXIMITY_WINDOW = 50
+
+
+def _scan_pairs(
+    starts: List[int], names: List[str], window: int
+) -> Dict[Tuple[str, str], None]:
+    """Return concept pairs whose occurrences lie within window characters.
+
+    starts must be sorted; names[i] is the concept occurring at starts[i].
+    For each occurrence, bisection bounds the candidates to those starting
+    between its end and its end + window, so only real matches are visited.
+    The result is a dict used as an ordered set.
+    """
+    pairs: Dict[Tuple[str, str], None] = {}
+    for i, (start, name) in enumerate(zip(starts, names)):
+        end = start + len(name)
+        lo = bisect_left(starts, end, i + 1)
+        hi = bisect_right(starts, end + window, lo)
+        for j in range(lo, hi):
+            other = names[j]
+            if other != name:
+                pairs[(name, other)] = None
+    return pairs
+
+
+# Ranking key for get_top_concepts: importance first, frequency as tie-break.
+_CONCEPT_SORT_KEY = attrgetter("importance_score", "frequency")
+
+
+@dataclass(slots=True)
 class ConceptGraph:
     """Graph of concepts and their relationships.
 
@@ -48,19 +117,30 @@ class ConceptGraph:
 
     concepts: Dict[str, ConceptNode] = field(default_factory=dict)
     concept_pairs: Set[Tuple[str, str]] = field(default_factory=set)
-
-    def add_concept(self, concept: str, context: str) -> None:
+    # Union-find over concept keys, maintained by relate_concepts so that
+    # find_concept_clusters never has to walk the graph.
+    _parent: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _rank: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    # Bumped by add_concept and relate_concepts so cached syntheses can tell
+    # the graph changed, including when callers mutate it directly.
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def add_concept(self, concept: str, doc_id: int) -> None:
         """Add or update a concept in the graph.
 
         Args:
             concept: Concept text
-            context: Context where concept appeared
+            doc_id: ID of the conversation where the concept appeared
         """
-        concept_key = concept.lower()
+        # Interned so the graph's dicts, sets and pairs share one key object
+        concept_key = sys.intern(concept.lower())
         if concept_key not in self.concepts:
             self.concepts[concept_key] = ConceptNode(concept=concept)
+            self._parent[concept_key] = concept_key
+            self._rank[concept_key] = 0
 
-        self.concepts[concept_key].add_context(context)
+        self.concepts[concept_key].add_context(doc_id)
+        self._version += 1
 
     def relate_concepts(self, concept1: str, concept2: str) -> None:
         """Create relationship between two concepts.
@@ -69,15 +149,40 @@ def relate_concepts(self, concept1: str, concept2: str) -> None:
             concept1: First concept
             concept2: Second concept
         """
-        key1 = concept1.lower()
-        key2 = concept2.lower()
+        key1 = sys.intern(concept1.lower())
+        key2 = sys.intern(concept2.lower())
 
         if key1 in self.concepts and key2 in self.concepts:
             self.concepts[key1].relate_to(key2)
             self.concepts[key2].relate_to(key1)
 
-            pair = tuple(sorted([key1, key2]))
+            pair = (key1, key2) if key1 < key2 else (key2, key1)
             self.concept_pairs.add(pair)
+            self._union(key1, key2)
+            self._version += 1
+
+    def _find(self, key: str) -> str:
+        """Return the cluster root for a concept key (with path halving)."""
+        parent = self._parent
+        root = parent.setdefault(key, key)
+        while parent[root] != root:
+            parent[root] = parent[parent[root]]
+            root = parent[root]
+        return root
+
+    def _union(self, key1: str, key2: str) -> None:
+        """Merge the clusters containing two concept keys (union by rank)."""
+        root1 = self._find(key1)
+        root2 = self._find(key2)
+        if root1 == root2:
+            return
+        rank1 = self._rank.get(root1, 0)
+        rank2 = self._rank.get(root2, 0)
+        if rank1 < rank2:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        if rank1 == rank2:
+            self._rank[root1] = rank1 + 1
 
     def get_top_concepts(self, n: int = 10) -> List[ConceptNode]:
         """Get top N concepts by importance.
@@ -88,12 +193,7 @@ def get_top_concepts(self, n: int = 10) -> List[ConceptNode]:
         Returns:
             List of top ConceptNode objects
         """
-        sorted_concepts = sorted(
-            self.concepts.values(),
-            key=lambda c: (c.importance_score, c.frequency),
-            reverse=True,
-        )
-        return sorted_concepts[:n]
+        return heapq.nlargest(n, self.concepts.values(), key=_CONCEPT_SORT_KEY)
 
     def find_concept_clusters(self) -> List[Set[str]]:
         """Find clusters of related concepts.
@@ -101,29 +201,19 @@ def find_concept_clusters(self) -> List[Set[str]]:
         Returns:
             List of concept clusters (sets of concept names)
         """
-        visited = set()
-        clusters = []
-
-        def dfs(concept_key: str, cluster: Set[str]) -> None:
-            """Depth-first search to find connected concepts."""
-            if concept_key in visited:
-                return
-
-            visited.add(concept_key)
-            cluster.add(concept_key)
+        groups: Dict[str, Set[str]] = defaultdict(set)
+        for concept_key in self.concepts:
+            groups[self._find(concept_key)].add(concept_key)
 
-            if concept_key in self.concepts:
-                for related in self.concepts[concept_key].related_concepts:
-                    dfs(related, cluster)
+        return [cluster for cluster in groups.values() if len(cluster) > 1]
 
-        for concept_key in self.concepts:
-            if concept_key not in visited:
-                cluster = set()
-                dfs(concept_key, cluster)
-                if len(cluster) > 1:
-                    clusters.append(cluster)
 
-        return clusters
+# Static section headings for ReflectionEngine.synthesize
+_SYNTHESIS_HEADER = "## Synthesis of Recent Conversations\n"
+_THEMES_HEADER = "### Key Themes"
+_CLUSTERS_HEADER = "### Connected Ideas"
+_NARRATIVE_HEADER = "### Emerging Narrative"
+_FOCUS_HEADER = "\n### Focused Insight"
 
 
 class ReflectionEngine:
@@ -140,6 +230,10 @@ def __init__(self):
         """Initialize reflection engine."""
         self.concept_graph = ConceptGraph()
         self.conversation_history: List[str] = []
+        # synthesize() results keyed by focus, valid while _synth_state
+        # (graph, graph version, corpus size) still matches.
+        self._synth_cache: Dict[Optional[str], str] = {}
+        self._synth_state: Tuple[Optional[ConceptGraph], int, int] = (None, -1, -1)
 
     def add_conversation(self, text: str) -> None:
         """Add a conversation to the reflection corpus.
@@ -148,13 +242,16 @@ def add_conversation(self, text: str) -> None:
             text: Conversation text to analyze
         """
         self.conversation_history.append(text)
+        doc_id = len(self.conversation_history) - 1
 
-        concepts = self._extract_concepts(text)
+        # Lowercase once; extraction and relationship detection share it.
+        text_lower = text.lower()
+        concepts = self._extract_concepts(text_lower)
 
         for concept in concepts:
-            self.concept_graph.add_concept(concept, text)
+            self.concept_graph.add_concept(concept, doc_id)
 
-        self._identify_relationships(concepts, text)
+        self._identify_relationships(concepts, text_lower)
 
     def synthesize(self, focus: Optional[str] = None) -> str:
         """Synthesize insights from conversation history.
@@ -168,37 +265,46 @@ def synthesize(self, focus: Optional[str] = None) -> str:
         if not self.conversation_history:
             return "No conversations to synthesize yet."
 
+        graph = self.concept_graph
+        state = (graph, graph._version, len(self.conversation_history))
+        stored_graph, stored_version, stored_size = self._synth_state
+        if stored_graph is not graph or (stored_version, stored_size) != state[1:]:
+            self._synth_cache.clear()
+            self._synth_state = state
+        cached = self._synth_cache.get(focus)
+        if cached is not None:
+            return cached
+
         top_concepts = self.concept_graph.get_top_concepts(10)
         clusters = self.concept_graph.find_concept_clusters()
 
-        parts = ["## Synthesis of Recent Conversations\n"]
+        parts = [_SYNTHESIS_HEADER]
 
         if top_concepts:
-            parts.append("### Key Themes")
-            for i, concept in enumerate(top_concepts[:5], 1):
-                parts.append(
-                    f"{i}. **{concept.concept}** (appeared {concept.frequency} times)"
-                )
-            parts.append("")
+            themes = "\n".join(
+                f"{i}. **{concept.concept}** (appeared {concept.frequency} times)"
+                for i, concept in enumerate(top_concepts[:5], 1)
+            )
+            parts.append(f"{_THEMES_HEADER}\n{themes}\n")
 
         if clusters:
-            parts.append("### Connected Ideas")
-            for i, cluster in enumerate(clusters[:3], 1):
-                concept_names = [
-                    self.concept_graph.concepts[c].concept for c in cluster
-                ]
-                parts.append(f"{i}. {' ↔ '.join(concept_names[:5])}")
-            parts.append("")
-
-        parts.append("### Emerging Narrative")
-        narrative = self._build_narrative(top_concepts, clusters)
-        parts.append(narrative)
+            concepts = self.concept_graph.concepts
+            connected = "\n".join(
+                f"{i}. {' ↔ '.join(concepts[c].concept for c in islice(cluster, 5))}"
+                for i, cluster in enumerate(clusters[:3], 1)
+            )
+            parts.append(f"{_CLUSTERS_HEADER}\n{connected}\n")
+
+        parts.append(_NARRATIVE_HEADER)
+        parts.append(self._build_narrative(top_concepts, clusters))
 
         if focus:
-            parts.append("\n### Focused Insight")
+            parts.append(_FOCUS_HEADER)
             parts.append(self._generate_focus_section(focus, top_concepts))
 
-        return "\n".join(parts)
+        result = "\n".join(parts)
+        self._synth_cache[focus] = result
+        return result
 
     def _build_narrative(
         self, top_concepts: List[ConceptNode], clusters: List[Set[str]]
@@ -242,44 +348,43 @@ def _generate_focus_section(
             return f"The focus area '{focus}' intersects with: {', '.join(related)}."
         return f"No direct connections found for focus area '{focus}', but it may relate to emerging themes."
 
-    def _extract_concepts(self, text: str) -> List[str]:
-        """Extract potential concepts from text."""
-        normalized = re.sub(r"[^a-zA-Z0-9\s]", " ", text.lower())
-        words = normalized.split()
-        stopwords = {
-            "the",
-            "and",
-            "of",
-            "to",
-            "a",
-            "in",
-            "for",
-            "is",
-            "on",
-            "with",
-            "that",
-            "by",
-            "this",
-            "it",
-            "from",
-            "as",
-            "are",
-            "an",
-            "be",
-            "or",
-            "at",
-        }
-        candidates = [w for w in words if len(w) > 3 and w not in stopwords]
-        return list(dict.fromkeys(candidates))
-
-    def _identify_relationships(self, concepts: List[str], text: str) -> None:
-        """Identify relationships between concepts in the same text."""
-        for i, concept in enumerate(concepts):
-            for related in concepts[i + 1 :]:
-                if self._concepts_are_related(concept, related, text):
-                    self.concept_graph.relate_concepts(concept, related)
-
-    def _concepts_are_related(self, concept1: str, concept2: str, text: str) -> bool:
-        """Determine if two concepts are related based on proximity."""
-        pattern = rf"{concept1}.{{0,50}}{concept2}|{concept2}.{{0,50}}{concept1}"
-        return bool(re.search(pattern, text, re.IGNORECASE | re.DOTALL))
+    def _extract_concepts(self, text_lower: str) -> List[str]:
+        """Extract potential concepts from already-lowercased text."""
+        seen: Set[str] = set()
+        concepts: List[str] = []
+        seen_add = seen.add
+        concepts_append = concepts.append
+        for word in _NON_ALNUM_RE.sub(" ", text_lower).split():
+            if len(word) > 3 and word not in STOPWORDS and word not in seen:
+                seen_add(word)
+                concepts_append(word)
+        return concepts
+
+    def _identify_relationships(self, concepts: List[str], text_lower: str) -> None:
+        """Identify relationships between concepts in the same lowercased text.
+
+        Two concepts are related when an occurrence of one ends at most
+        _PROXIMITY_WINDOW characters before an occurrence of the other
+        starts. All occurrences are sorted by offset once and swept with a
+        window, rather than testing every concept pair against the text.
+        """
+        occurrences = sorted(
+            (start, concept)
+            for concept in concepts
+            for start in self._find_occurrences(concept, text_lower)
+        )
+        starts = [start for start, _ in occurrences]
+        names = [concept for _, concept in occurrences]
+
+        for concept, other in _scan_pairs(starts, names, _PROXIMITY_WINDOW):
+            self.concept_graph.relate_concepts(concept, other)
+
+    @staticmethod
+    def _find_occurrences(concept: str, text: str) -> List[int]:
+        """Return every start offset of concept in text."""
+        offsets = []
+        start = text.find(concept)
+        while start != -1:
+            offsets.append(start)
+            start = text.find(concept, start + 1)
+        return offsets
@@ -14,7 +14,7 @@
 
 import re
 import time
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from .atp_models import ATPActionType, ATPMessage, ATPMode, ATPPriority
 
@@ -44,6 +44,22 @@
     )
 
 
+def _build_enum_map(enum_class) -> Dict[str, Any]:
+    """Map lowercased member values and names to members (values win)."""
+    lookup = {member.name.lower(): member for member in enum_class}
+    lookup.update((member.value.lower(), member) for member in enum_class)
+    return lookup
+
+
+# Header value lookups, built once at import instead of per parsed field
+_MODE_MAP = _build_enum_map(ATPMode)
+_PRIORITY_MAP = _build_enum_map(ATPPriority)
+_ACTION_MAP = _build_enum_map(ATPActionType)
+
+# Separator lines (---) left behind once headers are removed
+_SEPARATOR_RE = re.compile(r"\n\s*-{3,}\s*\n")
+
+
 class ATPParser:
     """Parser for ATP-formatted messages.
 
@@ -82,6 +98,11 @@ def parse(self, raw_input: str) -> ATPMessage:
         """
         message = ATPMessage(raw_input=raw_input)
 
+        # Neither header format can match without its marker; skip the regexes
+        if not self._may_contain_headers(raw_input):
+            message.content = raw_input.strip()
+            return message
+
         # Try hash format first
         headers, content = self._extract_headers(raw_input, self.hash_regex)
 
@@ -100,6 +121,11 @@ def parse(self, raw_input: str) -> ATPMessage:
 
         return message
 
+    @staticmethod
+    def _may_contain_headers(text: str) -> bool:
+        """Cheap pre-check: both header formats need '#' or '[[' to match."""
+        return "#" in text or "[[" in text
+
     def _extract_headers(self, text: str, pattern: re.Pattern) -> Tuple[dict, str]:
         """Extract ATP headers and remaining content.
 
@@ -111,22 +137,26 @@ def _extract_headers(self, text: str, pattern: re.Pattern) -> Tuple[dict, str]:
             Tuple of (headers dict, remaining content)
         """
         headers = {}
-        matches = pattern.findall(text)
+        content_parts = []
+        last_end = 0
 
-        if not matches:
-            return headers, text
-
-        # Extract headers
-        for tag, value in matches:
+        # Single pass: collect headers and keep the text between them as content
+        for match in pattern.finditer(text):
+            tag, value = match.groups()
             tag_lower = tag.lower().replace("_", "")
             if tag_lower in self.ATP_TAGS:
                 headers[tag_lower] = value.strip()
+            content_parts.append(text[last_end : match.start()])
+            last_end = match.end()
+
+        if not content_parts:
+            return headers, text
 
-        # Remove headers from content
-        content = pattern.sub("", text)
+        content_parts.append(text[last_end:])
+        content = "".join(content_parts)
 
         # Clean up separator lines (---)
-        content = re.sub(r"\n\s*-{3,}\s*\n", "\n\n", content)
+        content = _SEPARATOR_RE.sub("\n\n", content)
 
         return headers, content
 
@@ -139,7 +169,7 @@ def _populate_message_fields(self, message: ATPMessage, headers: dict) -> None:
         """
         # Mode
         if "mode" in headers:
-            message.mode = self._parse_enum(headers["mode"], ATPMode, ATPMode)
+            message.mode = _MODE_MAP.get(headers["mode"].lower(), ATPMode.UNKNOWN)
 
         # Context
         if "context" in headers:
@@ -147,14 +177,14 @@ def _populate_message_fields(self, message: ATPMessage, headers: dict) -> None:
 
         # Priority
         if "priority" in headers:
-            message.priority = self._parse_enum(
-                headers["priority"], ATPPriority, ATPPriority.NORMAL
+            message.priority = _PRIORITY_MAP.get(
+                headers["priority"].lower(), ATPPriority.NORMAL
             )
 
         # Action Type
         if "actiontype" in headers:
-            message.action_type = self._parse_enum(
-                headers["actiontype"], ATPActionType, ATPActionType.UNKNOWN
+            message.action_type = _ACTION_MAP.get(
+                headers["actiontype"].lower(), ATPActionType.UNKNOWN
             )
 
         # Target Zone
@@ -197,6 +227,8 @@ def detect_format(self, text: str) -> Optional[str]:
         Returns:
             'hash' for #Tag: format, 'bracket' for [[Tag]]: format, None if neither
         """
+        if not self._may_contain_headers(text):
+            return None
         if self.hash_regex.search(text):
             return "hash"
         elif self.bracket_regex.search(text):
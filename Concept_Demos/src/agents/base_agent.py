@@ -35,7 +35,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 try:
     from utils.helpers import logger
@@ -47,6 +47,19 @@
 
     from ..agent_types import TaskContext, TaskResult
 
+# Child loggers keyed by agent name, so constructing many agents
+# with the same name skips the name sanitizing and logging manager lookup.
+_CHILD_LOGGER_CACHE: Dict[str, Logger] = {}
+
+
+def _child_logger(name: str) -> Logger:
+    """Return the cached child logger for an agent name."""
+    child = _CHILD_LOGGER_CACHE.get(name)
+    if child is None:
+        child = logger.getChild(name.replace(" ", "_"))
+        _CHILD_LOGGER_CACHE[name] = child
+    return child
+
 
 class BaseAgent(ABC):
     """
@@ -116,7 +129,7 @@ def __init__(
 
         self.name: str = name
         self.capabilities: List[str] = capabilities if capabilities is not None else []
-        self._logger: Logger = logger.getChild(self.name.replace(" ", "_"))
+        self._logger: Logger = _child_logger(self.name)
         self._logger.info(
             f"{self.name} initialized with capabilities: {self.capabilities}"
         )
@@ -2,6 +2,14 @@
 import time
 import random
 
+# Static parts of the simulated response, built once at import.
+_DATASET_FINDING = "Relevant data set discovered at Source B."
+_RECOMMENDATIONS = (
+    "Follow up on Author A's work",
+    "Analyze Source B data",
+)
+_PROGRESS_CHOICES = ("significant progress", "new challenges", "interesting paradigms")
+
 
 class ResearchAgent(BaseAgent):
     def __init__(self, name: str = "Research Agent"):
@@ -9,7 +17,8 @@ def __init__(self, name: str = "Research Agent"):
 
     def perform_task(self, task_context: dict) -> dict:
         topic = task_context.get("topic", task_context.get("title", "unknown topic"))
-        keywords = task_context.get("keywords", "").split(",")
+        raw_keywords = task_context.get("keywords", "")
+        keywords = [k for k in raw_keywords.split(",") if k] if raw_keywords else []
         depth = task_context.get("depth", "overview")
 
         self.report_status(f"Starting research on '{topic}' with depth '{depth}'...")
@@ -21,14 +30,15 @@ def perform_task(self, task_context: dict) -> dict:
         # Simulate findings
         findings = [
             f"Found key paper on {topic} by Author A (2023).",
-            f"Relevant data set discovered at Source B.",
+            _DATASET_FINDING,
             f"Emerging trend: X in {topic} field.",
         ]
 
+        focus_area = random.choice(keywords) if keywords else "data analysis"
         summary = (
             f"Initial research on '{topic}' has been completed. "
-            f"Key findings indicate {random.choice(['significant progress', 'new challenges', 'interesting paradigms'])}. "
-            f"Further investigation into specific areas like {random.choice(keywords) or 'data analysis'} is recommended."
+            f"Key findings indicate {random.choice(_PROGRESS_CHOICES)}. "
+            f"Further investigation into specific areas like {focus_area} is recommended."
         )
 
         self.report_status("Research completed.")
@@ -40,8 +50,5 @@ def perform_task(self, task_context: dict) -> dict:
                 f"Simulated academic database for {topic}",
                 f"Simulated online encyclopedia for {topic}",
             ],
-            "recommendations": [
-                "Follow up on Author A's work",
-                "Analyze Source B data",
-            ],
+            "recommendations": list(_RECOMMENDATIONS),
         }
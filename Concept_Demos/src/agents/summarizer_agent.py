@@ -1,6 +1,13 @@
 from .base_agent import BaseAgent
 import time
 
+# Static parts of the simulated response, built once at import.
+_NO_CONTENT_SUMMARY = "No content was provided for summarization."
+_MAIN_POINTS = (
+    "Identified main topic based on initial words.",
+    "Extracted key phrases.",
+)
+
 
 class SummarizerAgent(BaseAgent):
     def __init__(self, name: str = "Summarizer Agent"):
@@ -12,7 +19,7 @@ def perform_task(self, task_context: dict) -> dict:
             self.report_status("No content provided to summarize.")
             return {
                 "status": "failed",
-                "summary": "No content was provided for summarization.",
+                "summary": _NO_CONTENT_SUMMARY,
             }
 
         self.report_status(
@@ -36,8 +43,5 @@ def perform_task(self, task_context: dict) -> dict:
             "original_length": len(text_to_summarize),
             "summary": summary,
             "summary_length": len(summary),
-            "main_points_extracted": [
-                "Identified main topic based on initial words.",
-                "Extracted key phrases.",
-            ],
+            "main_points_extracted": list(_MAIN_POINTS),
         }
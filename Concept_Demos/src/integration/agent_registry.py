@@ -1,38 +1,104 @@
 # src/integration/agent_registry.py
 
-from dataclasses import dataclass
-from typing import Dict, List
-import json
+import atexit
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import os
 import sqlite3
+import threading
 import time
 
 try:
     from agents.base_agent import BaseAgent
     from utils.helpers import logger
+    from utils.serialization import dumps as _dumps
 except ImportError:
     from ..agents.base_agent import BaseAgent
     from ..utils.helpers import logger
+    from ..utils.serialization import dumps as _dumps
 
 
-@dataclass
+# Kept as fixed strings so sqlite3's per-connection statement cache, which
+# is keyed on the SQL text, reuses the prepared statements across calls.
+_UPDATE_SCORE_SQL = """
+    UPDATE agents
+    SET alignment = ?, accuracy = ?, efficiency = ?, updated_at = ?
+    WHERE name = ?
+"""
+
+
+@lru_cache(maxsize=16)
+def _upsert_agents_sql(row_count: int) -> str:
+    """Multi-row agent UPSERT for ``row_count`` agents (8 parameters each)."""
+    values = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?)"] * row_count)
+    return f"""
+        INSERT INTO agents (name, capabilities, description, alignment, accuracy, efficiency, created_at, updated_at)
+        VALUES {values}
+        ON CONFLICT(name) DO UPDATE SET
+            capabilities = excluded.capabilities,
+            description = COALESCE(excluded.description, agents.description),
+            alignment = COALESCE(agents.alignment, excluded.alignment),
+            accuracy = COALESCE(agents.accuracy, excluded.accuracy),
+            efficiency = COALESCE(agents.efficiency, excluded.efficiency),
+            updated_at = excluded.updated_at
+        RETURNING name, alignment, accuracy, efficiency
+    """
+
+
+_SCORE_DIMENSIONS = frozenset(("alignment", "accuracy", "efficiency"))
+
+
+@dataclass(slots=True)
 class AgentScore:
     alignment: float  # 0.0-1.0 policy adherence
     accuracy: float  # 0.0-1.0 output quality
     efficiency: float  # 0.0-1.0 speed/cost metric
-
-    @property
-    def composite_score(self) -> float:
-        """Weighted composite score"""
-        return self.alignment * 0.4 + self.accuracy * 0.4 + self.efficiency * 0.2
+    # Weighted composite score, kept current whenever a dimension changes so
+    # routing reads a plain attribute instead of recomputing it per compare.
+    composite_score: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._refresh_composite()
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        # composite_score is only set once __init__ has assigned every field
+        if name in _SCORE_DIMENSIONS and hasattr(self, "composite_score"):
+            self._refresh_composite()
+
+    def _refresh_composite(self):
+        object.__setattr__(
+            self,
+            "composite_score",
+            self.alignment * 0.4 + self.accuracy * 0.4 + self.efficiency * 0.2,
+        )
 
 
 class AgentRegistryStore:
     """Lightweight SQLite-backed store for agent registry metadata and scores."""
 
+    # Applied to every connection; the registry is tiny, so a modest page
+    # cache is plenty. Busy waits use sqlite3's default 5s timeout.
+    _CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-8000",
+    )
+
+    # Agents per multi-row UPSERT; 8 bound parameters each keeps a batch far
+    # below SQLite's host-parameter limit.
+    _UPSERT_BATCH = 500
+
     def __init__(self, db_path: str = "data/agent_registry.db"):
         self.db_path = db_path
         self._ensure_db_directory()
+        # One connection for the store's lifetime (which also keeps a
+        # :memory: registry alive between calls); _lock serialises access.
+        self._lock = threading.RLock()
+        self._conn = self._open_connection()
         self._initialize_database()
 
     def _ensure_db_directory(self):
@@ -44,27 +110,70 @@ def _ensure_db_directory(self):
             os.makedirs(db_dir, exist_ok=True)
             logger.info(f"Created agent registry database directory: {db_dir}")
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the store's connection with its PRAGMAs applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for pragma in self._CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Hold the lock and run a transaction on the shared connection."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # Rows are keyed by name and stored inline in the primary-key B-tree,
+    # so name lookups need no separate unique index or rowid indirection.
+    _AGENTS_TABLE_SQL = """
+        CREATE TABLE IF NOT EXISTS agents (
+            name TEXT PRIMARY KEY,
+            capabilities TEXT NOT NULL,
+            description TEXT,
+            alignment REAL,
+            accuracy REAL,
+            efficiency REAL,
+            created_at REAL,
+            updated_at REAL
+        ) WITHOUT ROWID
+    """
+
     def _initialize_database(self):
         """Create the agents table if it doesn't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS agents (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    capabilities TEXT NOT NULL,
-                    description TEXT,
-                    alignment REAL,
-                    accuracy REAL,
-                    efficiency REAL,
-                    created_at TEXT,
-                    updated_at TEXT
-                )
-                """)
+        with self._connection() as conn:
+            if self.db_path != ":memory:":
+                # WAL persists in the file: appends instead of rollback-journal
+                # copies, and score reads no longer block on writers.
+                conn.execute("PRAGMA journal_mode=WAL")
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(agents)")}
+            if "id" in columns:
+                self._migrate_rowid_table(conn)
+            conn.execute(self._AGENTS_TABLE_SQL)
             conn.commit()
 
+    def _migrate_rowid_table(self, conn: sqlite3.Connection):
+        """Rebuild a pre-WITHOUT ROWID agents table, keeping its rows."""
+        logger.info("Migrating agent registry table to WITHOUT ROWID layout")
+        conn.executescript(f"""
+            BEGIN;
+            ALTER TABLE agents RENAME TO agents_rowid;
+            {self._AGENTS_TABLE_SQL};
+            INSERT INTO agents
+            SELECT name, capabilities, description, alignment, accuracy,
+                   efficiency, CAST(created_at AS REAL), CAST(updated_at AS REAL)
+            FROM agents_rowid;
+            DROP TABLE agents_rowid;
+            COMMIT;
+            """)
+
     def load_scores(self) -> Dict[str, AgentScore]:
         """Load persisted scores for all agents."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT name, alignment, accuracy, efficiency
                 FROM agents
@@ -82,95 +191,133 @@ def load_scores(self) -> Dict[str, AgentScore]:
 
     def upsert_agent(self, agent: BaseAgent, default_score: AgentScore) -> AgentScore:
         """Insert agent metadata if new; return persisted or default score."""
-        capabilities_json = json.dumps(agent.capabilities)
+        return self.upsert_agents([(agent, default_score)])[agent.name]
+
+    def upsert_agents(
+        self, agents_and_defaults: Iterable[Tuple[BaseAgent, AgentScore]]
+    ) -> Dict[str, AgentScore]:
+        """
+        Insert or refresh many agents in one transaction.
+
+        Rows are written with multi-row UPSERTs of up to _UPSERT_BATCH agents.
+        Existing scores win over the defaults (which also fill any NULL
+        scores), and RETURNING hands back what is stored.
+
+        Args:
+            agents_and_defaults: Iterable of (agent, default_score) pairs
+
+        Returns:
+            Mapping of agent name to its persisted score
+        """
         timestamp = time.time()
+        rows = [
+            (
+                agent.name,
+                _dumps(agent.capabilities),
+                getattr(agent, "description", None),
+                default_score.alignment,
+                default_score.accuracy,
+                default_score.efficiency,
+                timestamp,
+                timestamp,
+            )
+            for agent, default_score in agents_and_defaults
+        ]
 
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
-                "SELECT alignment, accuracy, efficiency FROM agents WHERE name = ?",
-                (agent.name,),
-            ).fetchone()
-
-            if row:
-                # Keep existing scores if present, otherwise fill with defaults
-                alignment, accuracy, efficiency = row
-                persisted_score = AgentScore(
-                    alignment=(
-                        alignment if alignment is not None else default_score.alignment
-                    ),
-                    accuracy=(
-                        accuracy if accuracy is not None else default_score.accuracy
-                    ),
-                    efficiency=(
-                        efficiency
-                        if efficiency is not None
-                        else default_score.efficiency
-                    ),
+        persisted: Dict[str, AgentScore] = {}
+        with self._connection() as conn:
+            for start in range(0, len(rows), self._UPSERT_BATCH):
+                batch = rows[start : start + self._UPSERT_BATCH]
+                cursor = conn.execute(
+                    _upsert_agents_sql(len(batch)),
+                    [value for row in batch for value in row],
                 )
-            else:
-                persisted_score = default_score
-
-            conn.execute(
-                """
-                INSERT INTO agents (name, capabilities, description, alignment, accuracy, efficiency, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(name) DO UPDATE SET
-                    capabilities = excluded.capabilities,
-                    description = COALESCE(excluded.description, agents.description),
-                    updated_at = excluded.updated_at
-                """,
-                (
-                    agent.name,
-                    capabilities_json,
-                    getattr(agent, "description", None),
-                    persisted_score.alignment,
-                    persisted_score.accuracy,
-                    persisted_score.efficiency,
-                    timestamp,
-                    timestamp,
-                ),
-            )
+                for name, alignment, accuracy, efficiency in cursor.fetchall():
+                    persisted[name] = AgentScore(
+                        alignment=float(alignment),
+                        accuracy=float(accuracy),
+                        efficiency=float(efficiency),
+                    )
             conn.commit()
 
-        return persisted_score
+        return persisted
 
     def update_score(self, agent_id: str, score: AgentScore):
         """Persist updated score for an agent."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                UPDATE agents
-                SET alignment = ?, accuracy = ?, efficiency = ?, updated_at = ?
-                WHERE name = ?
-                """,
-                (
-                    score.alignment,
-                    score.accuracy,
-                    score.efficiency,
-                    time.time(),
-                    agent_id,
-                ),
-            )
+        self.update_scores([(agent_id, score)])
+
+    def update_scores(self, scores: Iterable[Tuple[str, AgentScore]]):
+        """Persist updated scores for several agents in one transaction."""
+        timestamp = time.time()
+        rows = [
+            (score.alignment, score.accuracy, score.efficiency, timestamp, agent_id)
+            for agent_id, score in scores
+        ]
+        if not rows:
+            return
+        with self._connection() as conn:
+            conn.executemany(_UPDATE_SCORE_SQL, rows)
             conn.commit()
 
 
 class AgentRegistry:
-    def __init__(self, db_path: str = "data/agent_registry.db"):
+    def __init__(
+        self,
+        db_path: str = "data/agent_registry.db",
+        score_flush_interval: float = 1.0,
+    ):
         self.store = AgentRegistryStore(db_path=db_path)
         self.agents: Dict[str, BaseAgent] = {}
         self.scores: Dict[str, AgentScore] = self.store.load_scores()
+        # capability -> agent names, in registration order (dicts as ordered
+        # sets keep route_task's tie-breaking identical to a linear scan).
+        self._capability_index: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # len(self.agents) when the index was last brought up to date; a
+        # mismatch means agents were added or removed directly.
+        self._indexed_count = 0
+        # self.scores is authoritative; changed scores are written back by a
+        # background flusher every score_flush_interval seconds.
+        self.score_flush_interval = score_flush_interval
+        self._dirty_scores: Set[str] = set()
+        self._dirty_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = threading.Event()
 
     def register_agent(self, agent: BaseAgent):
         """Registers a new agent."""
-        if agent.name in self.agents:
-            logger.info(
-                f"Agent '{agent.name}' already registered; skipping duplicate registration."
-            )
+        self.register_agents([agent])
+
+    def register_agents(self, agents: Iterable[BaseAgent]):
+        """Registers several agents, persisting them in a single transaction."""
+        pending: Dict[str, BaseAgent] = {}
+        for agent in agents:
+            if agent.name in self.agents or agent.name in pending:
+                logger.info(
+                    f"Agent '{agent.name}' already registered; skipping duplicate registration."
+                )
+                continue
+            pending[agent.name] = agent
+        if not pending:
             return
-        default_score = AgentScore(alignment=0.5, accuracy=0.5, efficiency=0.5)
-        persisted_score = self.store.upsert_agent(agent, default_score)
-        self.agents[agent.name] = agent
-        self.scores[agent.name] = persisted_score
+
+        persisted_scores = self.store.upsert_agents(
+            (agent, AgentScore(alignment=0.5, accuracy=0.5, efficiency=0.5))
+            for agent in pending.values()
+        )
+        for name, agent in pending.items():
+            self.agents[name] = agent
+            self.scores[name] = persisted_scores[name]
+            for capability in agent.capabilities:
+                self._capability_index[capability][name] = None
+        self._indexed_count = len(self.agents)
+
+    def _rebuild_capability_index(self):
+        """Re-derive the capability index from self.agents."""
+        self._capability_index = defaultdict(dict)
+        for name, agent in self.agents.items():
+            for capability in agent.capabilities:
+                self._capability_index[capability][name] = None
+        self._indexed_count = len(self.agents)
 
     def get_agent(self, agent_name: str) -> BaseAgent:
         return self.agents.get(agent_name)
@@ -183,11 +330,26 @@ def route_task(self, task: dict) -> str:
                 "Task dictionary must contain a 'required_capability' key."
             )
 
+        # The index narrows the scan to agents that declared the capability.
+        # self.agents is public, so it is rebuilt when agents were added or
+        # removed directly, and each candidate is re-checked in case its
+        # capabilities changed. A capability gained after registration is
+        # only in the index after a rebuild, so an empty result falls back
+        # to scanning every agent.
+        agents = self.agents
+        if len(agents) != self._indexed_count:
+            self._rebuild_capability_index()
         candidates = [
-            agent.name
-            for agent in self.agents.values()
-            if required_capability in agent.capabilities
+            name
+            for name in self._capability_index.get(required_capability, ())
+            if name in agents and required_capability in agents[name].capabilities
         ]
+        if not candidates:
+            candidates = [
+                name
+                for name, agent in agents.items()
+                if required_capability in agent.capabilities
+            ]
 
         if not candidates:
             raise ValueError(
@@ -212,7 +374,54 @@ def update_score(self, agent_id: str, dimension: str, delta: float):
         setattr(self.scores[agent_id], dimension, new_score)
 
         self._log_score_change(agent_id, dimension, current_score, new_score)
-        self.store.update_score(agent_id, self.scores[agent_id])
+        with self._dirty_lock:
+            self._dirty_scores.add(agent_id)
+        if self._flusher is None:
+            self._start_flusher()
+
+    def _start_flusher(self):
+        with self._dirty_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                name="agent-score-flusher",
+                daemon=True,
+            )
+            self._flusher.start()
+            atexit.register(self.flush_scores)
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.score_flush_interval):
+            try:
+                self.flush_scores()
+            except Exception as exc:
+                # e.g. "database is locked" while another process writes;
+                # the ids stay dirty and are retried on the next tick.
+                logger.warning("Failed to flush agent scores: %s", exc)
+
+    def flush_scores(self):
+        """Write every score changed since the last flush in one transaction."""
+        with self._dirty_lock:
+            dirty, self._dirty_scores = self._dirty_scores, set()
+        if not dirty:
+            return
+        try:
+            self.store.update_scores(
+                (agent_id, self.scores[agent_id]) for agent_id in dirty
+            )
+        except Exception:
+            with self._dirty_lock:
+                self._dirty_scores |= dirty
+            raise
+
+    def close(self):
+        """Stop the background flusher, persist pending scores, and close."""
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush_scores()
+        self.store.close()
 
     def _log_score_change(self, agent_id, dimension, old_score, new_score):
         logger.info(
@@ -3,24 +3,46 @@
 when repeated divergence is detected.
 """
 
-import json
+import atexit
+import queue
+import threading
 import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, TextIO
 
 from ..utils.helpers import logger
+from ..utils.serialization import dumps as _dumps
 
 
 class GovernanceMonitor:
     """Tracks failures and emits alerts/rollback signals after thresholds are crossed."""
 
+    # Most log lines a background write coalesces into one append.
+    _WRITE_BATCH = 256
+
     def __init__(
-        self, alert_threshold: int = 3, log_path: str = "data/governance_events.log"
+        self,
+        alert_threshold: int = 3,
+        log_path: str = "data/governance_events.log",
+        max_events: int = 1000,
     ):
         self.alert_threshold = alert_threshold
         self.log_path = Path(log_path)
         self._failure_streak = 0
-        self._events: List[Dict] = []
+        # Bounded in-memory history; the JSONL log keeps the full record.
+        self._events: Deque[Dict] = deque(maxlen=max_events)
+        # Event log lines are appended by a background writer so callers
+        # never wait on file I/O; flush() blocks until they are on disk.
+        # A None entry asks the writer to close the log file.
+        self._pending: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        # Append handle owned by the writer thread, opened on first write and
+        # kept for the monitor's lifetime instead of reopened per batch. Only
+        # the writer thread opens or closes it.
+        self._log_file: Optional[TextIO] = None
         if self.log_path.parent:
             self.log_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -58,16 +80,76 @@ def record_success(self):
         self._failure_streak = 0
 
     def _persist_event(self, event: Dict):
-        """Append event to governance log as JSONL."""
-        try:
-            with self.log_path.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(event) + "\n")
-        except OSError:
-            logger.warning("Failed to write governance event log.")
+        """Queue event for the background writer to append as JSONL."""
+        self._pending.put(_dumps(event) + "\n")
+        if self._writer is None:
+            self._start_writer()
+
+    def _start_writer(self):
+        with self._writer_lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._drain_events, name="governance-log-writer", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.close)
+
+    def _drain_events(self):
+        """Append queued lines, coalescing whatever is waiting into one write."""
+        while True:
+            lines = [self._pending.get()]
+            while lines[-1] is not None and len(lines) < self._WRITE_BATCH:
+                try:
+                    lines.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            close_requested = lines[-1] is None
+            if close_requested:
+                lines.pop()
+            try:
+                if lines:
+                    if self._log_file is None:
+                        self._log_file = self.log_path.open("a", encoding="utf-8")
+                    self._log_file.writelines(lines)
+                    self._log_file.flush()
+                if close_requested:
+                    self._close_log_file()
+            except Exception as exc:
+                # Keep the writer alive so queued events still drain and
+                # flush() keeps returning.
+                logger.warning("Failed to write governance event log: %s", exc)
+                self._close_log_file()
+            finally:
+                for _ in range(len(lines) + close_requested):
+                    self._pending.task_done()
+
+    def flush(self):
+        """Block until every queued event has been written to the log."""
+        self._pending.join()
+
+    def close(self):
+        """Flush queued events and release the log file handle."""
+        if self._writer is not None:
+            # The writer closes the handle so it never races a write
+            self._pending.put(None)
+        self.flush()
+
+    def _close_log_file(self):
+        log_file, self._log_file = self._log_file, None
+        if log_file is not None:
+            try:
+                log_file.close()
+            except OSError:
+                pass
 
     def get_failure_streak(self) -> int:
         return self._failure_streak
 
     def get_recent_events(self, limit: int = 50) -> List[Dict]:
         """Return recent events from memory; does not re-read the file."""
-        return self._events[-limit:]
+        if limit <= 0:
+            return list(self._events)[-limit:]
+        recent = list(islice(reversed(self._events), limit))
+        recent.reverse()
+        return recent
@@ -8,9 +8,11 @@
 
 from __future__ import annotations
 
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..mcp.vector_store import LocalVectorStore
 from ..obsidian_integration.manager import ObsidianManager
@@ -18,12 +20,15 @@
 
 # Lazy import to avoid circular dependency
 _run_logger = None
+# Set once the first lookup has run, so a failed import is not retried per call
+_run_logger_loaded = False
 
 
 def _get_run_logger():
     """Lazy load run logger to avoid circular imports."""
-    global _run_logger
-    if _run_logger is None:
+    global _run_logger, _run_logger_loaded
+    if not _run_logger_loaded:
+        _run_logger_loaded = True
         try:
             from ..utils.run_logger import get_run_logger
 
@@ -33,6 +38,11 @@ def _get_run_logger():
     return _run_logger
 
 
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds since a time.perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) / 1_000_000
+
+
 try:
     from prometheus_client import Counter, Gauge, Histogram
 
@@ -72,10 +82,16 @@ class MemoryBus:
     """
     Coordinates knowledge writes and reads across Obsidian and the vector store.
 
-    - Writes go to the vector store first, then Obsidian (write-through).
+    - Writes stage the embedding, write Obsidian, then commit it (write-through).
     - Reads prioritize exact note lookup, then lightweight keyword scan, then vector recall.
     """
 
+    _SCAN_CHUNK_BYTES = 64 * 1024
+    _SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    # Directory mtimes this close to the walk may still change within the same
+    # timestamp tick, so such walks are not cached.
+    _INDEX_SETTLE_NS = 1_000_000_000
+
     def __init__(
         self,
         obsidian_manager: ObsidianManager,
@@ -88,6 +104,8 @@ def __init__(
         self.search_dirs = search_dirs or []
         self._vault_path: Optional[Path] = getattr(obsidian_manager, "vault_path", None)
         self.governance_monitor = governance_monitor
+        # search folder -> ({directory: st_mtime_ns}, note paths) from the last walk
+        self._note_index: Dict[Path, Tuple[Dict[Path, int], List[Path]]] = {}
 
     def write_note_with_embedding(
         self,
@@ -108,45 +126,50 @@ def write_note_with_embedding(
         Returns:
             Dictionary with latency metrics and doc identifiers.
         """
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         doc_id = self._normalize_doc_id(relative_path)
 
-        write_metadata = {"path": relative_path}
-        if metadata:
-            write_metadata.update(metadata)
+        # Single dict build: path first so caller metadata can still override it
+        write_metadata = (
+            {"path": relative_path, **metadata} if metadata else {"path": relative_path}
+        )
 
         vector_latency_ms = None
         file_latency_ms = None
 
-        # Write-through: semantic first, then explicit storage
+        # Write-through: the embedding is staged first, the note is written,
+        # and only then is the staged embedding committed to the vector store.
         if embed:
-            vector_start = time.perf_counter()
-            self.vector_store.upsert(doc_id, content, write_metadata)
-            vector_latency_ms = (time.perf_counter() - vector_start) * 1000
-            if METRICS_ENABLED:
-                WRITE_VECTOR_LATENCY.observe(vector_latency_ms)
+            vector_start = time.perf_counter_ns()
+            self.vector_store.stage(doc_id, content, write_metadata)
+            vector_ns = time.perf_counter_ns() - vector_start
 
         try:
-            file_start = time.perf_counter()
+            file_start = time.perf_counter_ns()
             self.obsidian_manager.write_note(relative_path, content)
-            file_latency_ms = (time.perf_counter() - file_start) * 1000
+            file_latency_ms = _elapsed_ms(file_start)
             if METRICS_ENABLED:
                 WRITE_FILE_LATENCY.observe(file_latency_ms)
         except Exception as exc:
-            # Roll back semantic write to avoid divergence
+            # Nothing reached the vector store yet; just drop the staged entry
             if embed:
-                try:
-                    self.vector_store.delete(doc_id)
-                except (
-                    Exception
-                ) as rollback_exc:  # pragma: no cover - best-effort rollback
-                    logger.warning(
-                        f"MemoryBus rollback failed for {doc_id}: {rollback_exc}"
-                    )
+                self.vector_store.discard(doc_id)
                 self._record_governance_failure(doc_id, relative_path, str(exc))
             raise exc
 
-        total_latency_ms = (time.perf_counter() - start) * 1000
+        if embed:
+            commit_start = time.perf_counter_ns()
+            try:
+                self.vector_store.commit(doc_id)
+            except Exception as exc:
+                self._record_governance_failure(doc_id, relative_path, str(exc))
+                raise exc
+            vector_ns += time.perf_counter_ns() - commit_start
+            vector_latency_ms = vector_ns / 1_000_000
+            if METRICS_ENABLED:
+                WRITE_VECTOR_LATENCY.observe(vector_latency_ms)
+
+        total_latency_ms = _elapsed_ms(start)
         if METRICS_ENABLED:
             WRITE_TOTAL_LATENCY.observe(total_latency_ms)
             # Using total latency as a proxy for sync lag budget
@@ -165,7 +188,7 @@ def write_note_with_embedding(
 
         # Log to run logger
         run_logger = _get_run_logger()
-        if run_logger:
+        if run_logger and run_logger.enabled_for("memory_bus_write"):
             run_logger.log_memory_bus_operation(
                 operation="write",
                 path=relative_path,
@@ -194,11 +217,11 @@ def read(
         Order: exact path lookup → keyword scan across configured folders →
         vector recall as a final fallback.
         """
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         results: List[Dict] = []
 
         if relative_path:
-            exact_start = time.perf_counter()
+            exact_start = time.perf_counter_ns()
             content = self.obsidian_manager.read_note(relative_path)
             if content:
                 results.append(
@@ -207,7 +230,7 @@ def read(
                         "path": relative_path,
                         "content": content,
                         "score": 1.0,
-                        "latency_ms": (time.perf_counter() - exact_start) * 1000,
+                        "latency_ms": _elapsed_ms(exact_start),
                     }
                 )
                 if METRICS_ENABLED:
@@ -221,11 +244,11 @@ def read(
 
         remaining = max_results - len(results)
         if remaining > 0 and self.vector_store.count() > 0:
-            vector_start = time.perf_counter()
+            vector_start = time.perf_counter_ns()
             vector_hits = self.vector_store.query(
                 query, top_k=remaining, include_content=True
             )
-            vector_latency = (time.perf_counter() - vector_start) * 1000
+            vector_latency = _elapsed_ms(vector_start)
             for doc_id, score, metadata, content in vector_hits:
                 results.append(
                     {
@@ -244,13 +267,13 @@ def read(
             if METRICS_ENABLED and vector_hits:
                 READ_SOURCE_COUNTER.labels(source="vector").inc(len(vector_hits))
 
-        total_latency_ms = (time.perf_counter() - start) * 1000
+        total_latency_ms = _elapsed_ms(start)
         for record in results:
             record.setdefault("total_latency_ms", total_latency_ms)
 
         # Log to run logger
         run_logger = _get_run_logger()
-        if run_logger:
+        if run_logger and run_logger.enabled_for("memory_bus_read"):
             sources_used = list(set(r.get("source", "unknown") for r in results))
             run_logger.log_memory_bus_operation(
                 operation="read",
@@ -293,33 +316,123 @@ def _keyword_scan(self, query: str, limit: int) -> List[Dict]:
             return []
 
         lowered_query = query.lower()
-        found: List[Dict] = []
-
+        # ASCII queries are matched against raw bytes so non-matching notes
+        # are never decoded or lowercased as a whole.
+        needle = (
+            lowered_query.encode("ascii")
+            if lowered_query and lowered_query.isascii()
+            else None
+        )
+
+        paths: List[Path] = []
         for folder in self.search_dirs:
             folder_path = self._vault_path / folder
-            if not folder_path.exists():
-                continue
+            if folder_path.exists():
+                paths.extend(self._list_notes(folder_path))
+        if not paths or limit <= 0:
+            return []
 
-            for path in folder_path.rglob("*.md"):
-                try:
-                    text = path.read_text(encoding="utf-8")
-                except (OSError, UnicodeDecodeError):
-                    continue
+        def scan(path: Path) -> Optional[Dict]:
+            return self._scan_one(path, lowered_query, needle)
 
-                if lowered_query in text.lower():
-                    relative_path = str(path.relative_to(self._vault_path))
-                    found.append(
-                        {
-                            "source": "keyword",
-                            "path": relative_path,
-                            "content": text,
-                            "score": 1.0,
-                        }
-                    )
-                    if len(found) >= limit:
-                        return found
+        found: List[Dict] = []
+        # Reads are I/O bound, so a thread pool overlaps them; map() keeps
+        # results in folder order and the remaining files are cancelled
+        # once the limit is reached.
+        pool = ThreadPoolExecutor(max_workers=min(self._SCAN_MAX_WORKERS, len(paths)))
+        try:
+            for hit in pool.map(scan, paths):
+                if hit is None:
+                    continue
+                found.append(hit)
+                if len(found) >= limit:
+                    break
+        finally:
+            pool.shutdown(cancel_futures=True)
         return found
 
+    def _scan_one(
+        self, path: Path, lowered_query: str, needle: Optional[bytes]
+    ) -> Optional[Dict]:
+        """Return a keyword hit for ``path``, or None if it does not match."""
+        try:
+            if needle is not None and not self._file_contains(path, needle):
+                return None
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        if needle is None and lowered_query not in text.lower():
+            return None
+        return {
+            "source": "keyword",
+            "path": str(path.relative_to(self._vault_path)),
+            "content": text,
+            "score": 1.0,
+        }
+
+    def _list_notes(self, folder_path: Path) -> List[Path]:
+        """
+        Return every .md file under ``folder_path``.
+
+        The listing is reused while no directory in the tree has a new mtime,
+        so repeated scans cost one stat per directory instead of a full walk.
+        """
+        cached = self._note_index.get(folder_path)
+        if cached is not None:
+            dir_mtimes, notes = cached
+            try:
+                if all(
+                    os.stat(directory).st_mtime_ns == mtime
+                    for directory, mtime in dir_mtimes.items()
+                ):
+                    return notes
+            except OSError:
+                pass
+
+        walk_started = time.time_ns()
+        dir_mtimes = {}
+        notes = []
+        pending = [folder_path]
+        while pending:
+            directory = pending.pop()
+            try:
+                # Stat before listing so a change made mid-walk shows up next time
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.name.endswith(".md") and entry.is_file():
+                    notes.append(Path(entry.path))
+
+        if all(
+            walk_started - mtime > self._INDEX_SETTLE_NS
+            for mtime in dir_mtimes.values()
+        ):
+            self._note_index[folder_path] = (dir_mtimes, notes)
+        else:
+            self._note_index.pop(folder_path, None)
+        return notes
+
+    @classmethod
+    def _file_contains(cls, path: Path, needle: bytes) -> bool:
+        """Case-insensitively search a file for an ASCII needle, chunk by chunk."""
+        overlap = len(needle) - 1
+        tail = b""
+        with path.open("rb") as fh:
+            while True:
+                chunk = fh.read(cls._SCAN_CHUNK_BYTES)
+                if not chunk:
+                    return False
+                window = tail + chunk.lower()
+                if needle in window:
+                    return True
+                # Keep enough of the window to catch a match spanning chunks
+                tail = window[-overlap:] if overlap else b""
+
     @staticmethod
     def _normalize_doc_id(relative_path: str) -> str:
         """Create a stable doc id from a vault-relative path."""
@@ -7,9 +7,11 @@
 
 import sqlite3
 import os
+import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Iterable, Iterator, Optional, List, Tuple
 from ..utils.helpers import logger
 
 # Lazy import to avoid circular dependency
@@ -39,6 +41,32 @@ class HebbianWeightManager:
     - Weight threshold for pruning: configurable
     """
 
+    # Applied when the connection is opened. synchronous=NORMAL is durable under WAL
+    # except for the last transactions on power loss, which is acceptable
+    # for learned weights.
+    _CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-65536",
+    )
+
+    # Signed-delta upsert used by bulk_update: positive deltas count as
+    # successes, negative ones as failures, and weights never drop below 0.
+    _BULK_UPSERT_SQL = """
+        INSERT INTO node_connections
+            (origin_node, target_node, weight, activation_count, success_count,
+             failure_count, last_updated, created_at)
+        VALUES (:origin, :target, MAX(0, :delta), 1, :success, :failure, :now, :now)
+        ON CONFLICT(origin_node, target_node)
+        DO UPDATE SET
+            weight = MAX(0, weight + :delta),
+            activation_count = activation_count + 1,
+            success_count = success_count + excluded.success_count,
+            failure_count = failure_count + excluded.failure_count,
+            last_updated = excluded.last_updated
+    """
+
     def __init__(self, db_path: str = "data/hebbian_weights.db"):
         """
         Initialize Hebbian weight manager with SQLite backend.
@@ -48,6 +76,10 @@ def __init__(self, db_path: str = "data/hebbian_weights.db"):
         """
         self.db_path = db_path
         self._ensure_db_directory()
+        # One connection for the manager's lifetime; _lock serialises access
+        # since it is shared across threads.
+        self._lock = threading.RLock()
+        self._conn = self._open_connection()
         self._initialize_database()
         logger.info(f"HebbianWeightManager initialized with database: {db_path}")
 
@@ -58,9 +90,30 @@ def _ensure_db_directory(self):
             os.makedirs(db_dir)
             logger.info(f"Created directory for Hebbian weights: {db_dir}")
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the manager's connection with the performance PRAGMAs applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for pragma in self._CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Hold the lock and run a transaction on the shared connection."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
     def _initialize_database(self):
         """Create the node_connections table if it doesn't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
+            # WAL persists in the database file: one fsync per commit instead
+            # of two, and readers no longer block the writer.
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS node_connections (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -75,14 +128,23 @@ def _initialize_database(self):
                     UNIQUE(origin_node, target_node)
                 )
             """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_origin
-                ON node_connections(origin_node)
-            """)
+            # idx_origin_weight (and the UNIQUE key) already lead with
+            # origin_node; a bare origin index only stored every name again.
+            conn.execute("DROP INDEX IF EXISTS idx_origin")
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_weight
                 ON node_connections(weight DESC)
             """)
+            # Per-node weight ordering, so get_strongest_connections() reads
+            # the top rows straight off the index instead of sorting.
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_origin_weight
+                ON node_connections(origin_node, weight DESC)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_target_weight
+                ON node_connections(target_node, weight DESC)
+            """)
             conn.commit()
 
     def strengthen_connection(self, origin: str, target: str) -> float:
@@ -98,33 +160,31 @@ def strengthen_connection(self, origin: str, target: str) -> float:
             New weight value
         """
         start_time = time.perf_counter()
-        current_weight = self.get_weight(origin, target)
-        new_weight = current_weight + 1
+        now = datetime.now().isoformat()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        # One UPSERT both applies the increment and reports the result, so
+        # there is no separate get_weight() round trip before the write.
+        with self._connection() as conn:
+            cursor = conn.execute(
                 """
                 INSERT INTO node_connections
                     (origin_node, target_node, weight, activation_count, success_count,
                      last_updated, created_at)
-                VALUES (?, ?, ?, 1, 1, ?, ?)
+                VALUES (?, ?, 1, 1, 1, ?, ?)
                 ON CONFLICT(origin_node, target_node)
                 DO UPDATE SET
                     weight = weight + 1,
                     activation_count = activation_count + 1,
                     success_count = success_count + 1,
                     last_updated = ?
+                RETURNING weight
             """,
-                (
-                    origin,
-                    target,
-                    new_weight,
-                    datetime.now().isoformat(),
-                    datetime.now().isoformat(),
-                    datetime.now().isoformat(),
-                ),
+                (origin, target, now, now, now),
             )
+            # RETURNING skips REAL affinity for integral values; keep floats.
+            new_weight = float(cursor.fetchone()[0])
             conn.commit()
+        current_weight = new_weight - 1
 
         latency_ms = (time.perf_counter() - start_time) * 1000
         logger.debug(
@@ -158,33 +218,35 @@ def weaken_connection(self, origin: str, target: str) -> float:
             New weight value
         """
         start_time = time.perf_counter()
-        current_weight = self.get_weight(origin, target)
-        new_weight = max(0, current_weight - 1)
+        now = datetime.now().isoformat()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._connection() as conn:
+            cursor = conn.execute(
                 """
                 INSERT INTO node_connections
                     (origin_node, target_node, weight, activation_count, failure_count,
                      last_updated, created_at)
-                VALUES (?, ?, ?, 1, 1, ?, ?)
+                VALUES (?, ?, 0, 1, 1, ?, ?)
                 ON CONFLICT(origin_node, target_node)
                 DO UPDATE SET
                     weight = MAX(0, weight - 1),
                     activation_count = activation_count + 1,
                     failure_count = failure_count + 1,
                     last_updated = ?
+                RETURNING weight, activation_count
             """,
-                (
-                    origin,
-                    target,
-                    new_weight,
-                    datetime.now().isoformat(),
-                    datetime.now().isoformat(),
-                    datetime.now().isoformat(),
-                ),
+                (origin, target, now, now, now),
             )
+            stored_weight, activation_count = cursor.fetchone()
+            new_weight = float(stored_weight)
             conn.commit()
+        # A first activation means the row was just inserted at 0. Once the
+        # floor is hit the prior weight is not recoverable and is logged as
+        # unchanged.
+        if activation_count == 1 or new_weight <= 0:
+            current_weight = new_weight
+        else:
+            current_weight = new_weight + 1
 
         latency_ms = (time.perf_counter() - start_time) * 1000
         logger.debug(
@@ -205,6 +267,84 @@ def weaken_connection(self, origin: str, target: str) -> float:
 
         return new_weight
 
+    def bulk_update(self, updates: Iterable[Tuple[str, str, float]]) -> int:
+        """
+        Apply many Hebbian updates in a single transaction.
+
+        Each update is an (origin, target, delta) tuple; a positive delta is
+        recorded as a success and a negative one as a failure, with the weight
+        floored at 0 as in weaken_connection(). Updates are applied in order
+        with one executemany(), so the commit cost is paid once per batch
+        rather than once per update.
+
+        Args:
+            updates: Iterable of (origin, target, delta) tuples
+
+        Returns:
+            Number of updates applied
+
+        Example:
+            >>> manager.bulk_update([("Agent A", "task_1", 1), ("Agent B", "task_2", -1)])
+            2
+        """
+        start_time = time.perf_counter()
+        now = datetime.now().isoformat()
+        rows = [
+            {
+                "origin": origin,
+                "target": target,
+                "delta": delta,
+                "success": 1 if delta > 0 else 0,
+                "failure": 1 if delta < 0 else 0,
+                "now": now,
+            }
+            for origin, target, delta in updates
+        ]
+        if not rows:
+            return 0
+
+        with self._connection() as conn:
+            conn.executemany(self._BULK_UPSERT_SQL, rows)
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        logger.debug("Hebbian: Applied %d bulk updates (%.2fms)", len(rows), latency_ms)
+
+        run_logger = _get_run_logger()
+        if run_logger and run_logger.enabled_for("hebbian_bulk_update"):
+            run_logger.log_event(
+                "hebbian_bulk_update",
+                "hebbian_weights",
+                {"updates": len(rows)},
+                f"Hebbian bulk update: {len(rows)} connections",
+                latency_ms,
+            )
+
+        return len(rows)
+
+    def strengthen_many(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """
+        Strengthen many connections in one transaction (ΔW = +1 each).
+
+        Args:
+            pairs: Iterable of (origin, target) tuples
+
+        Returns:
+            Number of connections updated
+        """
+        return self.bulk_update((origin, target, 1) for origin, target in pairs)
+
+    def weaken_many(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """
+        Weaken many connections in one transaction (ΔW = -1 each, minimum 0).
+
+        Args:
+            pairs: Iterable of (origin, target) tuples
+
+        Returns:
+            Number of connections updated
+        """
+        return self.bulk_update((origin, target, -1) for origin, target in pairs)
+
     def get_weight(self, origin: str, target: str) -> float:
         """
         Get current weight between two nodes.
@@ -216,7 +356,7 @@ def get_weight(self, origin: str, target: str) -> float:
         Returns:
             Current weight (0 if connection doesn't exist)
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT weight FROM node_connections
@@ -238,9 +378,11 @@ def get_connection_stats(self, origin: str, target: str) -> Optional[dict]:
         Returns:
             Dictionary with connection statistics or None
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
+        with self._connection() as conn:
+            # Row factory on the cursor only; the connection is shared.
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(
                 """
                 SELECT * FROM node_connections
                 WHERE origin_node = ? AND target_node = ?
@@ -264,7 +406,7 @@ def get_strongest_connections(
         Returns:
             List of (connected_node, weight) tuples
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             if direction == "outgoing":
                 cursor = conn.execute(
                     """
@@ -299,7 +441,7 @@ def get_agent_average_weight(self, agent_name: str) -> float:
         Returns:
             Average weight across all connections
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT AVG(weight) FROM node_connections
@@ -320,7 +462,7 @@ def get_agent_success_rate(self, agent_name: str) -> float:
         Returns:
             Success rate (0.0 to 1.0)
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT
@@ -337,6 +479,40 @@ def get_agent_success_rate(self, agent_name: str) -> float:
                 return result[0] / result[1]
             return 0.0
 
+    def get_agent_stats(self, agent_name: str) -> dict:
+        """
+        Calculate average weight and success rate for an agent in one scan.
+
+        Equivalent to calling get_agent_average_weight() and
+        get_agent_success_rate(), but aggregates the agent's connections once.
+
+        Args:
+            agent_name: Name of the agent
+
+        Returns:
+            Dictionary with connection count, average weight and success rate
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT
+                    COUNT(*),
+                    AVG(weight),
+                    SUM(success_count),
+                    SUM(activation_count)
+                FROM node_connections
+                WHERE origin_node = ?
+            """,
+                (agent_name,),
+            )
+            count, avg_weight, successes, activations = cursor.fetchone()
+
+        return {
+            "connections": count,
+            "average_weight": avg_weight if avg_weight is not None else 0.0,
+            "success_rate": successes / activations if activations else 0.0,
+        }
+
     def get_all_connections(self, min_weight: float = 0) -> List[dict]:
         """
         Get all connections above a minimum weight threshold.
@@ -347,8 +523,7 @@ def get_all_connections(self, min_weight: float = 0) -> List[dict]:
         Returns:
             List of connection dictionaries
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT * FROM node_connections
@@ -357,7 +532,10 @@ def get_all_connections(self, min_weight: float = 0) -> List[dict]:
             """,
                 (min_weight,),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            # Build each dict straight from the cursor's tuples rather than
+            # materializing sqlite3.Row objects with fetchall() first.
+            columns = [description[0] for description in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor]
 
     def prune_weak_connections(self, threshold: float = 0) -> int:
         """
@@ -369,7 +547,7 @@ def prune_weak_connections(self, threshold: float = 0) -> int:
         Returns:
             Number of connections pruned
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute(
                 """
                 DELETE FROM node_connections
@@ -389,7 +567,7 @@ def prune_weak_connections(self, threshold: float = 0) -> int:
 
     def reset_weights(self):
         """Reset all weights (for testing/debugging)."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("DELETE FROM node_connections")
             conn.commit()
         logger.warning("Hebbian: All weights reset!")
@@ -401,7 +579,7 @@ def get_network_summary(self) -> dict:
         Returns:
             Dictionary with network statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT
                     COUNT(*) as total_connections,
@@ -439,8 +617,7 @@ def get_connections_list(self, limit: int = 50) -> List[dict]:
         Returns:
             List of connection dictionaries with computed success rates
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT origin_node, target_node, weight, activation_count,
@@ -453,15 +630,20 @@ def get_connections_list(self, limit: int = 50) -> List[dict]:
             )
 
             connections = []
-            for row in cursor.fetchall():
-                conn_dict = dict(row)
-                # Compute success rate
-                if conn_dict["activation_count"] > 0:
-                    conn_dict["success_rate"] = (
-                        conn_dict["success_count"] / conn_dict["activation_count"]
-                    )
-                else:
-                    conn_dict["success_rate"] = 0.0
-                connections.append(conn_dict)
+            for origin, target, weight, activations, successes, failures in cursor:
+                connections.append(
+                    {
+                        "origin_node": origin,
+                        "target_node": target,
+                        "weight": weight,
+                        "activation_count": activations,
+                        "success_count": successes,
+                        "failure_count": failures,
+                        # Compute success rate
+                        "success_rate": (
+                            successes / activations if activations > 0 else 0.0
+                        ),
+                    }
+                )
 
             return connections
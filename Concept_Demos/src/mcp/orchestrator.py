@@ -41,8 +41,9 @@
 
 import os
 import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 from ..agents.artemis_agent import ArtemisAgent
 from ..agents.research_agent import ResearchAgent
@@ -94,6 +95,42 @@ def _sanitize_for_log(value: Any) -> str:
     )
 
 
+class TaskStatusTransaction:
+    """
+    Buffered status for a task note while a status transaction is open.
+
+    Status updates recorded here stay in memory; the owning Orchestrator
+    writes only the final status to the vault when the transaction exits.
+
+    Attributes:
+        relative_note_path: Vault-relative path of the task note.
+        task_id: Identifier of the task tracked by the note.
+        status: Latest buffered status (written on exit).
+    """
+
+    def __init__(
+        self,
+        relative_note_path: str,
+        task_id: Optional[str] = None,
+        status: str = "in progress",
+    ) -> None:
+        self.relative_note_path = relative_note_path
+        self.task_id = task_id
+        self.status = status
+
+    def set_status(self, new_status: str) -> None:
+        """Buffer a new status for the note."""
+        self.status = new_status
+
+    def complete(self) -> None:
+        """Mark the task as completed."""
+        self.set_status("completed")
+
+    def fail(self) -> None:
+        """Mark the task as failed."""
+        self.set_status("failed")
+
+
 class Orchestrator:
     """
     Central coordination layer for agent task execution.
@@ -148,6 +185,10 @@ def __init__(self) -> None:
         self.obs_manager = ObsidianManager(OBSIDIAN_VAULT_PATH)
         self.obs_parser = ObsidianParser()
         self.obs_generator = ObsidianGenerator()
+        self._status_transactions: Dict[str, TaskStatusTransaction] = {}
+        # Notes already parsed and found not pending, keyed by relative path
+        # to their (mtime_ns, size); unchanged notes are not re-read per sweep.
+        self._settled_notes: Dict[str, Tuple[int, int]] = {}
 
         # Initialize Hebbian learning layer
         self.hebbian = HebbianWeightManager()
@@ -182,9 +223,9 @@ def _register_agents(self) -> None:
             - ResearchAgent: Research and information gathering
             - SummarizerAgent: Content summarization
         """
-        self.agent_registry.register_agent(ArtemisAgent())
-        self.agent_registry.register_agent(ResearchAgent())
-        self.agent_registry.register_agent(SummarizerAgent())
+        self.agent_registry.register_agents(
+            [ArtemisAgent(), ResearchAgent(), SummarizerAgent()]
+        )
         logger.info(
             "All agent classes loaded and instances registered with the Agent Registry."
         )
@@ -490,31 +531,39 @@ def _update_hebbian_weights(self, agent_name: str, task_id: str, success: bool):
                 new_weight,
             )
 
-    def check_for_new_tasks_from_obsidian(self) -> List[Tuple[str, Dict[str, Any]]]:
+    def iter_new_tasks_from_obsidian(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """
-        Scan the Obsidian input directory for new pending tasks.
+        Lazily scan the Obsidian input directory for new pending tasks.
 
-        Reads all notes in AGENT_INPUT_DIR, parses them as task notes,
-        and returns those with status "pending".
+        Notes are read and parsed one at a time, so the caller can start
+        executing the first task before the rest of the folder is parsed.
+        Notes that were not pending on an earlier sweep are skipped without
+        being read again until their modification time or size changes.
 
-        Returns:
-            List of tuples (relative_note_path, parsed_task_data) for
-            all pending tasks found. Empty list if none found.
+        Yields:
+            Tuples (relative_note_path, parsed_task_data) for each note
+            whose status is "pending".
 
         Example:
-            >>> tasks = orchestrator.check_for_new_tasks_from_obsidian()
-            >>> for path, task_data in tasks:
-            ...     print(f"Found task: {task_data['title']}")
+            >>> for path, task_data in orchestrator.iter_new_tasks_from_obsidian():
+            ...     orchestrator.route_and_execute_task(task_data, path)
         """
         logger.info(
             "Checking for new tasks in Obsidian folder: %s",
             _sanitize_for_log(AGENT_INPUT_DIR),
         )
         input_notes = self.obs_manager.list_notes_in_folder(AGENT_INPUT_DIR)
+        settled = self._settled_notes
+        listed = set()
 
-        new_tasks = []
         for note_filename in input_notes:
             relative_path = os.path.join(AGENT_INPUT_DIR, note_filename)
+            listed.add(relative_path)
+            fingerprint = self.obs_manager.get_note_fingerprint(relative_path)
+            if fingerprint is not None and settled.get(relative_path) == fingerprint:
+                continue
+            settled.pop(relative_path, None)
+
             content = self.obs_manager.read_note(relative_path)
             if content:
                 task_data = self.obs_parser.parse_task_note(content)
@@ -533,21 +582,93 @@ def check_for_new_tasks_from_obsidian(self) -> List[Tuple[str, Dict[str, Any]]]:
                         _sanitize_for_log(task_data.get("title", note_filename)),
                         _sanitize_for_log(task_data.get("agent")),
                     )
-                    new_tasks.append((relative_path, task_data))
+                    yield relative_path, task_data
                 else:
                     logger.debug(
                         "Note '%s' is not a pending task or couldn't be parsed.",
                         _sanitize_for_log(note_filename),
                     )
+                    if fingerprint is not None:
+                        settled[relative_path] = fingerprint
 
-        return new_tasks
+        # Forget notes that have been removed from the folder
+        for relative_path in settled.keys() - listed:
+            del settled[relative_path]
+
+    def check_for_new_tasks_from_obsidian(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Scan the Obsidian input directory for new pending tasks.
+
+        Reads all notes in AGENT_INPUT_DIR, parses them as task notes,
+        and returns those with status "pending". Prefer
+        iter_new_tasks_from_obsidian() when tasks are processed one by one.
+
+        Returns:
+            List of tuples (relative_note_path, parsed_task_data) for
+            all pending tasks found. Empty list if none found.
+
+        Example:
+            >>> tasks = orchestrator.check_for_new_tasks_from_obsidian()
+            >>> for path, task_data in tasks:
+            ...     print(f"Found task: {task_data['title']}")
+        """
+        return list(self.iter_new_tasks_from_obsidian())
+
+    @contextmanager
+    def status_transaction(
+        self,
+        relative_note_path: str,
+        task_id: Optional[str] = None,
+        initial_status: str = "in progress",
+    ) -> Iterator[TaskStatusTransaction]:
+        """
+        Coalesce status updates for a task note into a single write.
+
+        While the transaction is open, update_task_status_in_obsidian()
+        calls for ``relative_note_path`` are buffered instead of rewriting
+        the note, so a task sweep costs one note rewrite per task rather
+        than one per status transition. If the block raises, the task is
+        marked "failed" before the final status is written.
+
+        Args:
+            relative_note_path: Vault-relative path of the task note.
+            task_id: Identifier of the task tracked by the note.
+            initial_status: Status to write if nothing else is recorded.
+
+        Yields:
+            The TaskStatusTransaction buffering the note's status.
+
+        Example:
+            >>> with orchestrator.status_transaction(path, "t001") as txn:
+            ...     orchestrator.route_and_execute_task(task, path)
+        """
+        txn = TaskStatusTransaction(relative_note_path, task_id, initial_status)
+        self._status_transactions[relative_note_path] = txn
+        try:
+            yield txn
+        except Exception:
+            txn.fail()
+            raise
+        finally:
+            del self._status_transactions[relative_note_path]
+            self.update_task_status_in_obsidian(
+                relative_note_path, txn.status, txn.task_id
+            )
 
     def update_task_status_in_obsidian(
         self, relative_note_path: str, new_status: str, task_id: str = None
     ):
         """
         Updates the status of a specific task note in Obsidian.
+
+        Inside a status_transaction() for the same note, the status is
+        buffered and written when the transaction exits.
         """
+        txn = self._status_transactions.get(relative_note_path)
+        if txn is not None:
+            txn.set_status(new_status)
+            return
+
         logger.info(
             "Updating status for task note '%s' to '%s'",
             _sanitize_for_log(relative_note_path),
@@ -583,13 +704,23 @@ def update_task_status_in_obsidian(
             )
 
     def create_new_task_in_obsidian(
-        self, task_data: dict, filename: str | None = None
+        self,
+        task_data: dict,
+        filename: str | None = None,
+        initial_status: str | None = None,
     ) -> str:
         """
         Creates a new task note in the AGENT_INPUT_DIR of Obsidian.
         Returns the relative path to the new note.
+
+        When initial_status is given it is written into the note's
+        frontmatter on creation, so callers that dispatch the task right
+        away do not need a second status rewrite.
         """
         task_title = task_data.get("title", "new_agent_task")
+        if initial_status:
+            task_data = dict(task_data)
+            task_data["status"] = initial_status
         resolved_capability = self._resolve_required_capability(task_data)
         if resolved_capability:
             task_data = dict(task_data)
@@ -669,10 +800,8 @@ def execute_all_pending_tasks(self) -> dict:
                 continue
 
             try:
-                self.update_task_status_in_obsidian(
-                    relative_note_path, "in progress", task_id
-                )
-                self.route_and_execute_task(task_data, relative_note_path)
+                with self.status_transaction(relative_note_path, task_id):
+                    self.route_and_execute_task(task_data, relative_note_path)
                 summary["completed"] += 1
                 summary["details"].append({"task_id": task_id, "status": "completed"})
             except Exception as exc:
@@ -682,9 +811,6 @@ def execute_all_pending_tasks(self) -> dict:
                     _sanitize_for_log(relative_note_path),
                     exc_info=True,
                 )
-                self.update_task_status_in_obsidian(
-                    relative_note_path, "failed", task_id
-                )
                 summary["failed"] += 1
                 summary["details"].append(
                     {"task_id": task_id, "status": "failed", "error": str(exc)}
@@ -739,8 +865,9 @@ def show_hebbian_network_summary(self):
 
     def show_agent_hebbian_stats(self, agent_name: str):
         """Display Hebbian statistics for a specific agent."""
-        avg_weight = self.hebbian.get_agent_average_weight(agent_name)
-        success_rate = self.hebbian.get_agent_success_rate(agent_name)
+        stats = self.hebbian.get_agent_stats(agent_name)
+        avg_weight = stats["average_weight"]
+        success_rate = stats["success_rate"]
         connections = self.hebbian.get_strongest_connections(agent_name, limit=10)
 
         logger.info("\n" + "=" * 60)
@@ -1,22 +1,30 @@
 """
 Lightweight vector store backed by SQLite to mimic pgvector-style storage locally.
 
-Embeddings are stored as JSON-encoded float arrays; cosine similarity is used for retrieval.
+Embeddings are stored as packed little-endian float64 blobs (rows written by older
+versions as JSON text are still read); cosine similarity is used for retrieval.
 This module is framework-agnostic and can be swapped for a real pgvector backend later.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import math
 import os
 import sqlite3
+import sys
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from ..utils.helpers import logger
 
+# Compact separators for stored metadata JSON; it is machine-read only.
+_JSON_SEPARATORS = (",", ":")
+
 # Lazy import to avoid circular dependency
 _run_logger = None
 
@@ -47,6 +55,30 @@ def _default_embedding(text: str, dim: int = 16) -> List[float]:
     return [v / norm for v in buckets]
 
 
+def _content_hash(content: str) -> str:
+    """Short, stable digest used to detect unchanged document content."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _pack_embedding(embedding: List[float]) -> bytes:
+    """Serialize an embedding as little-endian float64 bytes (8 bytes/value)."""
+    packed = array("d", embedding)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_embedding(stored) -> List[float]:
+    """Decode a stored embedding: packed bytes, or legacy JSON text."""
+    if isinstance(stored, str):
+        return json.loads(stored)
+    unpacked = array("d")
+    unpacked.frombytes(stored)
+    if sys.byteorder != "little":
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
 def _cosine_similarity(a: List[float], b: List[float]) -> float:
     if not a or not b or len(a) != len(b):
         return 0.0
@@ -67,7 +99,7 @@ class VectorRecord:
 class LocalVectorStore:
     """
     SQLite-backed vector store that mirrors pgvector-like usage.
-    Stores embeddings as JSON; retrieval computes cosine similarity in Python.
+    Stores embeddings as packed float blobs; retrieval computes cosine similarity in Python.
     """
 
     def __init__(
@@ -77,6 +109,8 @@ def __init__(
     ):
         self.db_path = db_path
         self.embedding_fn = embedding_fn or _default_embedding
+        # Embedded documents waiting on commit() or discard(), keyed by doc_id
+        self._staged: Dict[str, Tuple[str, List[float], Optional[Dict]]] = {}
         self._ensure_db_directory()
         self._initialize()
 
@@ -100,29 +134,72 @@ def _initialize(self):
                 """)
             conn.commit()
 
+    _UPSERT_SQL = """
+                INSERT INTO vectors (doc_id, embedding, metadata, content)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(doc_id) DO UPDATE SET
+                    embedding = excluded.embedding,
+                    metadata = excluded.metadata,
+                    content = excluded.content
+                """
+
     def upsert(self, doc_id: str, content: str, metadata: Optional[Dict] = None):
         """Insert or replace a document with its embedding."""
         start_time = time.perf_counter()
 
         embedding = self.embedding_fn(content)
-        metadata_json = json.dumps(metadata or {})
-        embedding_json = json.dumps(embedding)
+        self._write(doc_id, content, embedding, metadata, start_time)
+
+    def _write(
+        self,
+        doc_id: str,
+        content: str,
+        embedding: List[float],
+        metadata: Optional[Dict],
+        start_time: float,
+    ):
+        metadata_json = json.dumps(metadata or {}, separators=_JSON_SEPARATORS)
 
         with sqlite3.connect(self.db_path) as conn:
             conn.execute(
-                """
-                INSERT INTO vectors (doc_id, embedding, metadata, content)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(doc_id) DO UPDATE SET
-                    embedding = excluded.embedding,
-                    metadata = excluded.metadata,
-                    content = excluded.content
-                """,
-                (doc_id, embedding_json, metadata_json, content),
+                self._UPSERT_SQL,
+                (doc_id, _pack_embedding(embedding), metadata_json, content),
             )
             conn.commit()
 
         latency_ms = (time.perf_counter() - start_time) * 1000
+        self._log_upsert(doc_id, content, embedding, metadata, latency_ms)
+
+    def stage(self, doc_id: str, content: str, metadata: Optional[Dict] = None):
+        """
+        Embed a document and hold it in memory without touching the database.
+
+        The staged document is written by commit() or dropped by discard(),
+        so a caller can abandon a write without a compensating delete.
+        """
+        self._staged[doc_id] = (content, self.embedding_fn(content), metadata)
+
+    def commit(self, doc_id: str) -> bool:
+        """Write a staged document. Returns False if nothing was staged."""
+        staged = self._staged.pop(doc_id, None)
+        if staged is None:
+            return False
+        content, embedding, metadata = staged
+        self._write(doc_id, content, embedding, metadata, time.perf_counter())
+        return True
+
+    def discard(self, doc_id: str) -> bool:
+        """Drop a staged document. Returns False if nothing was staged."""
+        return self._staged.pop(doc_id, None) is not None
+
+    def _log_upsert(
+        self,
+        doc_id: str,
+        content: str,
+        embedding: List[float],
+        metadata: Optional[Dict],
+        latency_ms: float,
+    ):
         logger.debug(
             "Upserted doc_id=%s into vector store (%.2fms)", doc_id, latency_ms
         )
@@ -147,10 +224,105 @@ def upsert(self, doc_id: str, content: str, metadata: Optional[Dict] = None):
                 latency_ms=latency_ms,
             )
 
-    def upsert_many(self, records: Iterable[Tuple[str, str, Optional[Dict]]]):
-        """Bulk upsert helper."""
+    def _metadata_if_changed(
+        self, doc_id: str, content: str, metadata: Optional[Dict]
+    ) -> Optional[Dict]:
+        """Return metadata stamped with the content hash, or None if unchanged."""
+        content_hash = _content_hash(content)
+        stored = self.get_metadata(doc_id)
+        if stored is not None and stored.get("content_hash") == content_hash:
+            logger.debug("Skipped unchanged doc_id=%s", doc_id)
+            return None
+        return {**(metadata or {}), "content_hash": content_hash}
+
+    def upsert_if_changed(
+        self, doc_id: str, content: str, metadata: Optional[Dict] = None
+    ) -> bool:
+        """
+        Upsert a document only if its content differs from the stored copy.
+
+        A content hash is kept in the document metadata so unchanged
+        documents skip re-embedding. Returns True when the document was written.
+        """
+        stamped = self._metadata_if_changed(doc_id, content, metadata)
+        if stamped is None:
+            return False
+        self.upsert(doc_id, content, stamped)
+        return True
+
+    def upsert_many(
+        self,
+        records: Iterable[Tuple[str, str, Optional[Dict]]],
+        skip_unchanged: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> int:
+        """
+        Bulk upsert helper.
+
+        Records are consumed lazily, so a generator can be passed to stream
+        documents in. With skip_unchanged, documents whose content hash
+        matches the stored copy are not re-embedded. With max_workers > 1,
+        embeddings are computed concurrently in a thread pool and written
+        in a single transaction (records are collected first). Returns the
+        number of records written.
+        """
+        if max_workers and max_workers > 1:
+            return self._upsert_many_parallel(records, skip_unchanged, max_workers)
+
+        written = 0
+        for doc_id, content, metadata in records:
+            if skip_unchanged:
+                written += self.upsert_if_changed(doc_id, content, metadata)
+            else:
+                self.upsert(doc_id, content, metadata)
+                written += 1
+        return written
+
+    def _upsert_many_parallel(
+        self,
+        records: Iterable[Tuple[str, str, Optional[Dict]]],
+        skip_unchanged: bool,
+        max_workers: int,
+    ) -> int:
+        """Embed records concurrently, then write them with one executemany."""
+        start_time = time.perf_counter()
+
+        pending: List[Tuple[str, str, Optional[Dict]]] = []
         for doc_id, content, metadata in records:
-            self.upsert(doc_id, content, metadata)
+            if skip_unchanged:
+                metadata = self._metadata_if_changed(doc_id, content, metadata)
+                if metadata is None:
+                    continue
+            pending.append((doc_id, content, metadata))
+        if not pending:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            embeddings = list(
+                pool.map(self.embedding_fn, [content for _, content, _ in pending])
+            )
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                self._UPSERT_SQL,
+                [
+                    (
+                        doc_id,
+                        _pack_embedding(embedding),
+                        json.dumps(metadata or {}, separators=_JSON_SEPARATORS),
+                        content,
+                    )
+                    for (doc_id, content, metadata), embedding in zip(
+                        pending, embeddings
+                    )
+                ],
+            )
+            conn.commit()
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        for (doc_id, content, metadata), embedding in zip(pending, embeddings):
+            self._log_upsert(doc_id, content, embedding, metadata, latency_ms)
+        return len(pending)
 
     def delete(self, doc_id: str):
         start_time = time.perf_counter()
@@ -178,14 +350,52 @@ def fetch_all(self) -> Iterable[VectorRecord]:
             cursor = conn.execute(
                 "SELECT doc_id, embedding, metadata, content FROM vectors"
             )
-            for doc_id, embedding_json, metadata_json, content in cursor.fetchall():
+            for doc_id, stored_embedding, metadata_json, content in cursor.fetchall():
                 yield VectorRecord(
                     doc_id=doc_id,
-                    embedding=json.loads(embedding_json),
+                    embedding=_unpack_embedding(stored_embedding),
                     metadata=json.loads(metadata_json or "{}"),
                     content=content,
                 )
 
+    def _iter_embeddings(self) -> Iterable[Tuple[str, List[float]]]:
+        """Yield (doc_id, embedding) pairs without loading metadata or content."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("SELECT doc_id, embedding FROM vectors")
+            for doc_id, stored_embedding in cursor.fetchall():
+                yield doc_id, _unpack_embedding(stored_embedding)
+
+    def _fetch_payloads(
+        self, doc_ids: List[str], include_content: bool
+    ) -> Dict[str, Tuple[Dict, Optional[str]]]:
+        """Load (metadata, content) for the given doc_ids in a single query."""
+        if not doc_ids:
+            return {}
+        columns = "doc_id, metadata, content" if include_content else "doc_id, metadata"
+        placeholders = ",".join("?" * len(doc_ids))
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                f"SELECT {columns} FROM vectors WHERE doc_id IN ({placeholders})",
+                doc_ids,
+            ).fetchall()
+        return {
+            row[0]: (
+                json.loads(row[1] or "{}"),
+                row[2] if include_content else None,
+            )
+            for row in rows
+        }
+
+    def get_metadata(self, doc_id: str) -> Optional[Dict]:
+        """Return the stored metadata for ``doc_id``, or None if it is not stored."""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT metadata FROM vectors WHERE doc_id = ?", (doc_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0] or "{}")
+
     def query(
         self, text: str, top_k: int = 5, include_content: bool = False
     ) -> List[Tuple]:
@@ -205,15 +415,22 @@ def query(
         start_time = time.perf_counter()
 
         query_embedding = self.embedding_fn(text)
-        scored: List[Tuple[str, float, Dict]] = []
-        for record in self.fetch_all():
-            score = _cosine_similarity(query_embedding, record.embedding)
+        # Rank on embeddings alone, then load metadata/content only for the
+        # top_k winners instead of decoding them for every stored row.
+        scored: List[Tuple[str, float]] = [
+            (doc_id, _cosine_similarity(query_embedding, embedding))
+            for doc_id, embedding in self._iter_embeddings()
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        top = scored[:top_k]
+        payloads = self._fetch_payloads([doc_id for doc_id, _ in top], include_content)
+        results: List[Tuple] = []
+        for doc_id, score in top:
+            metadata, content = payloads.get(doc_id, ({}, None))
             if include_content:
-                scored.append((record.doc_id, score, record.metadata, record.content))
+                results.append((doc_id, score, metadata, content))
             else:
-                scored.append((record.doc_id, score, record.metadata))
-        scored.sort(key=lambda item: item[1], reverse=True)
-        results = scored[:top_k]
+                results.append((doc_id, score, metadata))
 
         latency_ms = (time.perf_counter() - start_time) * 1000
 
@@ -27,14 +27,40 @@ def read_note(self, relative_path: str) -> str | None:
             logger.debug(f"Read note: {relative_path}")
             return content
 
+    def get_note_fingerprint(self, relative_path: str) -> tuple[int, int] | None:
+        """Returns (mtime_ns, size) for a note, or None if it cannot be stat'ed."""
+        try:
+            stat = os.stat(self._get_full_path(relative_path))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def write_note(self, relative_path: str, content: str, overwrite: bool = True):
-        """Writes content to an Obsidian note. Creates directories if necessary."""
+        """Writes content to an Obsidian note. Creates directories if necessary.
+
+        Overwrites go through a temporary file that is fsync'ed and renamed
+        over the note, so a crash never leaves a half-written note behind.
+        """
         full_path = self._get_full_path(relative_path)
         full_path.parent.mkdir(parents=True, exist_ok=True)
         mode = "w" if overwrite else "a"  # 'w' for overwrite, 'a' for append
-        with open(full_path, mode, encoding="utf-8") as f:
-            f.write(content)
-            logger.info(f"Wrote note: {relative_path} (mode: {mode})")
+        if not overwrite:
+            with open(full_path, mode, encoding="utf-8") as f:
+                f.write(content)
+                logger.info(f"Wrote note: {relative_path} (mode: {mode})")
+            return
+
+        tmp_path = full_path.with_name(f".{full_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, mode, encoding="utf-8") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        logger.info(f"Wrote note: {relative_path} (mode: {mode})")
 
     def list_notes_in_folder(
         self, relative_folder_path: str, suffix: str = ".md"
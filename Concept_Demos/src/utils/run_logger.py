@@ -7,15 +7,20 @@
 - Structured event tracking for all database operations
 """
 
+import atexit
 import json
 import os
 import sqlite3
+import struct
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from contextlib import contextmanager
 
+from .serialization import dumps as _dumps
+
 
 class RunLogger:
     """
@@ -26,6 +31,107 @@ class RunLogger:
     - Vector embedding log table for semantic tracking
     - Event log table for all operations (DB writes, task execution, etc.)
     - Structured JSON metadata for each event
+    - Per-event-type filtering via enabled / disabled_events
+    """
+
+    # Applied when the connection is opened. synchronous=NORMAL is durable under
+    # WAL except for the last transactions on power loss, which is acceptable
+    # for an audit log.
+    _CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",
+    )
+
+    # Bumped whenever _TABLE_SQL/_INDEX_SQL change in a way that needs
+    # _migrate_legacy_tables; stored in PRAGMA user_version.
+    _SCHEMA_VERSION = 1
+
+    # Plain INTEGER PRIMARY KEY (no AUTOINCREMENT) so inserts skip the
+    # sqlite_sequence update; log rows are never deleted, so ids still grow.
+    _TABLE_SQL = {
+        # Event log table - tracks all operations
+        "event_log": """
+            CREATE TABLE IF NOT EXISTS event_log (
+                id INTEGER PRIMARY KEY,
+                run_id TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                component TEXT NOT NULL,
+                message TEXT,
+                metadata TEXT,
+                duration_ms REAL,
+                created_at REAL NOT NULL
+            )
+        """,
+        # Vector log table - tracks all semantic embeddings
+        "vector_log": """
+            CREATE TABLE IF NOT EXISTS vector_log (
+                id INTEGER PRIMARY KEY,
+                run_id TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                doc_id TEXT NOT NULL,
+                operation TEXT NOT NULL,
+                content_preview TEXT,
+                embedding_dim INTEGER,
+                embedding_sample BLOB,
+                metadata TEXT,
+                latency_ms REAL,
+                created_at REAL NOT NULL
+            )
+        """,
+        # Database write log - tracks all DB operations
+        "db_write_log": """
+            CREATE TABLE IF NOT EXISTS db_write_log (
+                id INTEGER PRIMARY KEY,
+                run_id TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                database TEXT NOT NULL,
+                table_name TEXT NOT NULL,
+                operation TEXT NOT NULL,
+                record_id TEXT,
+                data_preview TEXT,
+                rows_affected INTEGER,
+                latency_ms REAL,
+                created_at REAL NOT NULL
+            )
+        """,
+    }
+
+    # (run_id, created_at) matches the per-run lookups: run counts, the
+    # MIN/MAX(created_at) in get_recent_runs and the ordered get_run_events.
+    _INDEX_SQL = (
+        "CREATE INDEX IF NOT EXISTS idx_event_run_ts ON event_log(run_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_event_type ON event_log(event_type)",
+        "CREATE INDEX IF NOT EXISTS idx_vector_run_ts"
+        " ON vector_log(run_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_vector_doc ON vector_log(doc_id)",
+        "CREATE INDEX IF NOT EXISTS idx_dbwrite_run_ts"
+        " ON db_write_log(run_id, created_at)",
+    )
+
+    _RUN_COUNTS_SQL = """
+        SELECT
+            (SELECT COUNT(*) FROM event_log WHERE run_id = :run_id),
+            (SELECT COUNT(*) FROM vector_log WHERE run_id = :run_id),
+            (SELECT COUNT(*) FROM db_write_log WHERE run_id = :run_id)
+    """
+    _INSERT_EVENT_SQL = """
+        INSERT INTO event_log
+        (run_id, timestamp, event_type, component, message, metadata, duration_ms, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _INSERT_VECTOR_SQL = """
+        INSERT INTO vector_log
+        (run_id, timestamp, doc_id, operation, content_preview,
+         embedding_dim, embedding_sample, metadata, latency_ms, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _INSERT_DB_WRITE_SQL = """
+        INSERT INTO db_write_log
+        (run_id, timestamp, database, table_name, operation,
+         record_id, data_preview, rows_affected, latency_ms, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     """
 
     def __init__(
@@ -33,12 +139,27 @@ def __init__(
         log_dir: str = "logs",
         db_path: str = "data/run_logs.db",
         run_id: Optional[str] = None,
+        enabled: bool = True,
+        disabled_events: Optional[Iterable[str]] = None,
+        batch_size: int = 128,
+        verbose_events: bool = False,
+        log_embedding_samples: bool = True,
     ):
         self.log_dir = Path(log_dir)
         self.db_path = db_path
         self.run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.enabled = enabled
+        self.disabled_events = frozenset(disabled_events or ())
+        # vector_log and db_write_log rows are also mirrored into event_log
+        # (and the markdown table) only when verbose_events is set.
+        self.verbose_events = verbose_events
+        # When False, vector_log rows carry no embedding_sample at all.
+        self.log_embedding_samples = log_embedding_samples
         self.run_start_time = time.perf_counter()
-        self._events: List[Dict] = []
+        # (whole second, its local ISO-8601 prefix), reused by _now()
+        self._iso_second: Tuple[int, str] = (-1, "")
+        # Events logged by this instance, reported as total_events at the end
+        self._event_count = 0
 
         # Ensure directories exist
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -46,87 +167,123 @@ def __init__(
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir, exist_ok=True)
 
-        # Initialize database
+        # One connection for the logger's lifetime instead of a connect per
+        # event; _lock serialises access since it is shared across threads.
+        self._lock = threading.RLock()
+        self._conn = self._open_connection()
         self._initialize_database()
 
-        # Initialize markdown file
+        # Rows are buffered per table and written with executemany once
+        # batch_size rows are pending, on flush(), or at interpreter exit.
+        self.batch_size = max(1, batch_size)
+        self._event_rows: List[tuple] = []
+        self._vector_rows: List[tuple] = []
+        self._db_write_rows: List[tuple] = []
+        self._pending_rows = 0
+
+        # Initialize markdown file. The handle stays open for the run so
+        # each event is a buffered write rather than an open/append/close.
         self.md_path = self.log_dir / f"run_{self.run_id}.md"
+        self._md_file = open(self.md_path, "w", encoding="utf-8", buffering=1 << 16)
         self._write_md_header()
+        atexit.register(self.close)
 
         # Log run start
         self.log_event("run_start", "system", {"run_id": self.run_id})
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the logger's connection with the performance PRAGMAs applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for pragma in self._CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Hold the lock and run a transaction on the shared connection."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self):
+        """Flush buffered output, then close the database and markdown file."""
+        with self._lock:
+            self.flush()
+            self._conn.close()
+            self._md_file.close()
+
+    def flush(self):
+        """Write every buffered log row to SQLite and the markdown file."""
+        with self._lock:
+            if not self._md_file.closed:
+                self._md_file.flush()
+            if not self._pending_rows:
+                return
+            with self._connection() as conn:
+                if self._event_rows:
+                    conn.executemany(self._INSERT_EVENT_SQL, self._event_rows)
+                if self._vector_rows:
+                    conn.executemany(self._INSERT_VECTOR_SQL, self._vector_rows)
+                if self._db_write_rows:
+                    conn.executemany(self._INSERT_DB_WRITE_SQL, self._db_write_rows)
+            self._event_rows.clear()
+            self._vector_rows.clear()
+            self._db_write_rows.clear()
+            self._pending_rows = 0
+
+    def _buffer_row(self, rows: List[tuple], row: tuple):
+        """Queue a row for the next flush, flushing once the batch is full."""
+        with self._lock:
+            rows.append(row)
+            self._pending_rows += 1
+            if self._pending_rows >= self.batch_size:
+                self.flush()
+
     def _initialize_database(self):
-        """Create logging tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            # Event log table - tracks all operations
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS event_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    run_id TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    component TEXT NOT NULL,
-                    message TEXT,
-                    metadata TEXT,
-                    duration_ms REAL,
-                    created_at REAL NOT NULL
-                )
-            """)
-
-            # Vector log table - tracks all semantic embeddings
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS vector_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    run_id TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    doc_id TEXT NOT NULL,
-                    operation TEXT NOT NULL,
-                    content_preview TEXT,
-                    embedding_dim INTEGER,
-                    embedding_sample TEXT,
-                    metadata TEXT,
-                    latency_ms REAL,
-                    created_at REAL NOT NULL
-                )
-            """)
-
-            # Database write log - tracks all DB operations
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS db_write_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    run_id TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    database TEXT NOT NULL,
-                    table_name TEXT NOT NULL,
-                    operation TEXT NOT NULL,
-                    record_id TEXT,
-                    data_preview TEXT,
-                    rows_affected INTEGER,
-                    latency_ms REAL,
-                    created_at REAL NOT NULL
-                )
-            """)
-
-            # Create indexes for efficient querying
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_event_run ON event_log(run_id)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_event_type ON event_log(event_type)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_vector_run ON vector_log(run_id)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_vector_doc ON vector_log(doc_id)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_dbwrite_run ON db_write_log(run_id)"
-            )
+        """Create logging tables if they don't exist, migrating older layouts."""
+        with self._connection() as conn:
+            if self.db_path != ":memory:":
+                # WAL persists in the database file: one fsync per commit
+                # instead of two, and readers no longer block the logger.
+                conn.execute("PRAGMA journal_mode=WAL")
+
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version < self._SCHEMA_VERSION:
+                self._migrate_legacy_tables(conn)
+
+            for table_sql in self._TABLE_SQL.values():
+                conn.execute(table_sql)
+            for index_sql in self._INDEX_SQL:
+                conn.execute(index_sql)
+            conn.execute(f"PRAGMA user_version = {self._SCHEMA_VERSION}")
 
             conn.commit()
 
+    def _migrate_legacy_tables(self, conn: sqlite3.Connection):
+        """Rebuild log tables created with AUTOINCREMENT, keeping their rows."""
+        placeholders = ", ".join("?" * len(self._TABLE_SQL))
+        cursor = conn.execute(
+            "SELECT name, sql FROM sqlite_master"
+            f" WHERE type = 'table' AND name IN ({placeholders})",
+            tuple(self._TABLE_SQL),
+        )
+        legacy = [name for name, sql in cursor if "AUTOINCREMENT" in sql.upper()]
+        # Single-column run_id indexes superseded by the (run_id, created_at) ones
+        script = [
+            "BEGIN;",
+            "DROP INDEX IF EXISTS idx_event_run;",
+            "DROP INDEX IF EXISTS idx_vector_run;",
+            "DROP INDEX IF EXISTS idx_dbwrite_run;",
+        ]
+        for name in legacy:
+            script += [
+                f"ALTER TABLE {name} RENAME TO {name}_legacy;",
+                f"{self._TABLE_SQL[name]};",
+                f"INSERT INTO {name} SELECT * FROM {name}_legacy;",
+                f"DROP TABLE {name}_legacy;",
+            ]
+        script.append("COMMIT;")
+        conn.executescript("\n".join(script))
+
     def _write_md_header(self):
         """Write the markdown file header."""
         header = f"""# MCP Run Log: {self.run_id}
@@ -142,8 +299,7 @@ def _write_md_header(self):
 | Timestamp | Component | Event | Details |
 |-----------|-----------|-------|---------|
 """
-        with open(self.md_path, "w", encoding="utf-8") as f:
-            f.write(header)
+        self._md_file.write(header)
 
     def _append_md_row(
         self, timestamp: str, component: str, event_type: str, details: str
@@ -152,13 +308,37 @@ def _append_md_row(
         # Escape pipe characters in details
         details_escaped = details.replace("|", "\\|").replace("\n", " ")
         row = f"| {timestamp} | {component} | {event_type} | {details_escaped} |\n"
-        with open(self.md_path, "a", encoding="utf-8") as f:
-            f.write(row)
+        with self._lock:
+            self._md_file.write(row)
 
     def _append_md_section(self, section: str):
         """Append a new section to the markdown file."""
-        with open(self.md_path, "a", encoding="utf-8") as f:
-            f.write(f"\n{section}\n")
+        with self._lock:
+            self._md_file.write(f"\n{section}\n")
+
+    def _now(self) -> Tuple[float, str]:
+        """
+        Return the current time as (epoch seconds, local ISO-8601 string).
+
+        Both values come from one clock read, and the date/time prefix is
+        formatted once per second rather than for every event.
+        """
+        now = time.time()
+        second = int(now)
+        cached_second, prefix = self._iso_second
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second).isoformat()
+            self._iso_second = (second, prefix)
+        return now, f"{prefix}.{int((now - second) * 1_000_000):06d}"
+
+    def enabled_for(self, event_type: str) -> bool:
+        """
+        Check whether events of this type will be recorded.
+
+        Callers can test this before building expensive metadata for
+        log_event().
+        """
+        return self.enabled and event_type not in self.disabled_events
 
     def log_event(
         self,
@@ -171,6 +351,8 @@ def log_event(
         """
         Log a general event.
 
+        Events whose type is not enabled_for() are dropped.
+
         Args:
             event_type: Type of event (e.g., 'task_start', 'db_write', 'error')
             component: Component name (e.g., 'orchestrator', 'memory_bus')
@@ -178,41 +360,27 @@ def log_event(
             message: Human-readable message
             duration_ms: Operation duration if applicable
         """
-        timestamp = datetime.now().isoformat()
-        created_at = time.time()
+        if not self.enabled_for(event_type):
+            return
 
-        event = {
-            "run_id": self.run_id,
-            "timestamp": timestamp,
-            "event_type": event_type,
-            "component": component,
-            "message": message,
-            "metadata": metadata,
-            "duration_ms": duration_ms,
-            "created_at": created_at,
-        }
-        self._events.append(event)
+        created_at, timestamp = self._now()
 
-        # Write to SQLite
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO event_log
-                (run_id, timestamp, event_type, component, message, metadata, duration_ms, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    self.run_id,
-                    timestamp,
-                    event_type,
-                    component,
-                    message,
-                    json.dumps(metadata) if metadata else None,
-                    duration_ms,
-                    created_at,
-                ),
-            )
-            conn.commit()
+        with self._lock:
+            self._event_count += 1
+
+        self._buffer_row(
+            self._event_rows,
+            (
+                self.run_id,
+                timestamp,
+                event_type,
+                component,
+                message,
+                _dumps(metadata) if metadata else None,
+                duration_ms,
+                created_at,
+            ),
+        )
 
         # Write to markdown
         details = message or ""
@@ -239,6 +407,10 @@ def log_vector_operation(
         """
         Log a vector store operation.
 
+        Mirrored into event_log only when verbose_events is set. The
+        embedding sample is stored as little-endian float32s, or NULL when
+        log_embedding_samples is off.
+
         Args:
             doc_id: Document identifier
             operation: Operation type ('upsert', 'query', 'delete')
@@ -247,54 +419,48 @@ def log_vector_operation(
             metadata: Additional metadata
             latency_ms: Operation latency
         """
-        timestamp = datetime.now().isoformat()
-        created_at = time.time()
+        created_at, timestamp = self._now()
 
         # Create content preview (first 100 chars)
         content_preview = content[:100] + "..." if len(content) > 100 else content
 
-        # Sample embedding (first 5 and last 5 values)
-        if len(embedding) > 10:
-            embedding_sample = embedding[:5] + ["..."] + embedding[-5:]
-        else:
-            embedding_sample = embedding
+        # Sample embedding (first 5 and last 5 values) as packed float32s;
+        # embedding_dim tells whether values were elided in between.
+        embedding_sample = None
+        if self.log_embedding_samples:
+            sample = embedding
+            if len(embedding) > 10:
+                sample = embedding[:5] + embedding[-5:]
+            embedding_sample = struct.pack(f"<{len(sample)}f", *sample)
+
+        self._buffer_row(
+            self._vector_rows,
+            (
+                self.run_id,
+                timestamp,
+                doc_id,
+                operation,
+                content_preview,
+                len(embedding),
+                embedding_sample,
+                _dumps(metadata) if metadata else None,
+                latency_ms,
+                created_at,
+            ),
+        )
 
-        # Write to SQLite
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO vector_log
-                (run_id, timestamp, doc_id, operation, content_preview,
-                 embedding_dim, embedding_sample, metadata, latency_ms, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    self.run_id,
-                    timestamp,
-                    doc_id,
-                    operation,
-                    content_preview,
-                    len(embedding),
-                    json.dumps(embedding_sample),
-                    json.dumps(metadata) if metadata else None,
-                    latency_ms,
-                    created_at,
-                ),
+        if self.verbose_events:
+            self.log_event(
+                f"vector_{operation}",
+                "vector_store",
+                {
+                    "doc_id": doc_id,
+                    "embedding_dim": len(embedding),
+                    "content_length": len(content),
+                },
+                f"Vector {operation}: {doc_id}",
+                latency_ms,
             )
-            conn.commit()
-
-        # Log as event too
-        self.log_event(
-            f"vector_{operation}",
-            "vector_store",
-            {
-                "doc_id": doc_id,
-                "embedding_dim": len(embedding),
-                "content_length": len(content),
-            },
-            f"Vector {operation}: {doc_id}",
-            latency_ms,
-        )
 
     def log_db_write(
         self,
@@ -309,6 +475,8 @@ def log_db_write(
         """
         Log a database write operation.
 
+        Mirrored into event_log only when verbose_events is set.
+
         Args:
             database: Database name/path
             table_name: Table being written to
@@ -318,55 +486,46 @@ def log_db_write(
             rows_affected: Number of rows affected
             latency_ms: Operation latency
         """
-        timestamp = datetime.now().isoformat()
-        created_at = time.time()
+        created_at, timestamp = self._now()
 
         # Create data preview
         data_preview = None
         if data:
             preview_items = list(data.items())[:5]
-            data_preview = json.dumps(dict(preview_items))
+            data_preview = _dumps(dict(preview_items))
             if len(data_preview) > 200:
                 data_preview = data_preview[:200] + "..."
 
-        # Write to SQLite
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO db_write_log
-                (run_id, timestamp, database, table_name, operation,
-                 record_id, data_preview, rows_affected, latency_ms, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    self.run_id,
-                    timestamp,
-                    database,
-                    table_name,
-                    operation,
-                    record_id,
-                    data_preview,
-                    rows_affected,
-                    latency_ms,
-                    created_at,
-                ),
-            )
-            conn.commit()
-
-        # Log as event too
-        self.log_event(
-            "db_write",
-            database.split("/")[-1],  # Just filename
-            {
-                "table": table_name,
-                "operation": operation,
-                "record_id": record_id,
-                "rows_affected": rows_affected,
-            },
-            f"{operation} on {table_name}",
-            latency_ms,
+        self._buffer_row(
+            self._db_write_rows,
+            (
+                self.run_id,
+                timestamp,
+                database,
+                table_name,
+                operation,
+                record_id,
+                data_preview,
+                rows_affected,
+                latency_ms,
+                created_at,
+            ),
         )
 
+        if self.verbose_events:
+            self.log_event(
+                "db_write",
+                database.split("/")[-1],  # Just filename
+                {
+                    "table": table_name,
+                    "operation": operation,
+                    "record_id": record_id,
+                    "rows_affected": rows_affected,
+                },
+                f"{operation} on {table_name}",
+                latency_ms,
+            )
+
     def log_task_execution(
         self,
         task_id: str,
@@ -498,25 +657,14 @@ def finalize_run(self, status: str = "completed", summary: Optional[Dict] = None
                 "run_id": self.run_id,
                 "status": status,
                 "duration_ms": run_duration_ms,
-                "total_events": len(self._events),
+                "total_events": self._event_count,
                 **(summary or {}),
             },
             f"Run {status} after {run_duration_ms:.0f}ms",
         )
 
         # Get statistics from database
-        with sqlite3.connect(self.db_path) as conn:
-            event_count = conn.execute(
-                "SELECT COUNT(*) FROM event_log WHERE run_id = ?", (self.run_id,)
-            ).fetchone()[0]
-
-            vector_count = conn.execute(
-                "SELECT COUNT(*) FROM vector_log WHERE run_id = ?", (self.run_id,)
-            ).fetchone()[0]
-
-            db_write_count = conn.execute(
-                "SELECT COUNT(*) FROM db_write_log WHERE run_id = ?", (self.run_id,)
-            ).fetchone()[0]
+        event_count, vector_count, db_write_count = self._run_counts()
 
         # Write summary section to markdown
         summary_md = f"""
@@ -538,7 +686,7 @@ def finalize_run(self, status: str = "completed", summary: Optional[Dict] = None
 """
 
         # Get event type breakdown
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             breakdown = conn.execute(
                 """
                 SELECT event_type, COUNT(*) as count
@@ -556,26 +704,24 @@ def finalize_run(self, status: str = "completed", summary: Optional[Dict] = None
         summary_md += f"\n---\n\n*Log generated at {datetime.now().isoformat()}*\n"
 
         self._append_md_section(summary_md)
+        self.flush()
 
     def get_run_stats(self) -> Dict:
         """Get statistics for the current run."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
-            stats = {
-                "run_id": self.run_id,
-                "event_count": conn.execute(
-                    "SELECT COUNT(*) FROM event_log WHERE run_id = ?", (self.run_id,)
-                ).fetchone()[0],
-                "vector_operations": conn.execute(
-                    "SELECT COUNT(*) FROM vector_log WHERE run_id = ?", (self.run_id,)
-                ).fetchone()[0],
-                "db_writes": conn.execute(
-                    "SELECT COUNT(*) FROM db_write_log WHERE run_id = ?", (self.run_id,)
-                ).fetchone()[0],
-            }
+        event_count, vector_count, db_write_count = self._run_counts()
+        return {
+            "run_id": self.run_id,
+            "event_count": event_count,
+            "vector_operations": vector_count,
+            "db_writes": db_write_count,
+        }
 
-            return stats
+    def _run_counts(self) -> Tuple[int, int, int]:
+        """Flush, then count this run's event, vector and db-write rows at once."""
+        self.flush()
+        with self._connection() as conn:
+            cursor = conn.execute(self._RUN_COUNTS_SQL, {"run_id": self.run_id})
+            return cursor.fetchone()
 
 
 # Global run logger instance (initialized on import or explicitly)
@@ -594,10 +740,24 @@ def init_run_logger(
     log_dir: str = "logs",
     db_path: str = "data/run_logs.db",
     run_id: Optional[str] = None,
+    enabled: bool = True,
+    disabled_events: Optional[Iterable[str]] = None,
+    batch_size: int = 128,
+    verbose_events: bool = False,
+    log_embedding_samples: bool = True,
 ) -> RunLogger:
     """Initialize a new run logger (resets the global instance)."""
     global _run_logger
-    _run_logger = RunLogger(log_dir=log_dir, db_path=db_path, run_id=run_id)
+    _run_logger = RunLogger(
+        log_dir=log_dir,
+        db_path=db_path,
+        run_id=run_id,
+        enabled=enabled,
+        disabled_events=disabled_events,
+        batch_size=batch_size,
+        verbose_events=verbose_events,
+        log_embedding_samples=log_embedding_samples,
+    )
     return _run_logger
 
 
@@ -0,0 +1,25 @@
+"""
+Compact JSON encoding shared by the SQLite and JSONL writers.
+
+Uses orjson when it is installed and falls back to the standard library.
+Output is machine-read only, so no whitespace is emitted either way.
+"""
+
+import json
+
+JSON_SEPARATORS = (",", ":")
+
+try:
+    import orjson
+
+    def dumps(obj) -> str:
+        # Callers pass arbitrary metadata; stringify non-str keys like json does.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+except ImportError:  # pragma: no cover - optional dependency
+
+    def dumps(obj) -> str:
+        return json.dumps(obj, separators=JSON_SEPARATORS)
+
+
+__all__ = ["JSON_SEPARATORS", "dumps"]
@@ -1,6 +1,8 @@
 """Tests for the agent registry (src/integration/agent_registry.py)."""
 
+import sqlite3
 import sys
+import time
 
 sys.modules.pop("integration.agent_registry", None)
 
@@ -34,6 +36,14 @@ def test_composite_score_zeros(self):
         s = AgentScore(alignment=0.0, accuracy=0.0, efficiency=0.0)
         assert s.composite_score == 0.0
 
+    def test_composite_score_tracks_dimension_changes(self):
+        s = AgentScore(alignment=0.5, accuracy=0.5, efficiency=0.5)
+        s.alignment = 1.0
+        setattr(s, "efficiency", 0.0)
+        assert abs(s.composite_score - (0.4 + 0.2)) < 0.001
+        assert s == AgentScore(alignment=1.0, accuracy=0.5, efficiency=0.0)
+        assert not hasattr(s, "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # AgentRegistryStore (file-based SQLite via tmp_path)
@@ -46,6 +56,11 @@ def store(self, tmp_path):
     def test_load_scores_empty(self, store):
         assert store.load_scores() == {}
 
+    def test_database_uses_wal_journal(self, store):
+        with store._connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
     def test_upsert_and_load(self, store):
         agent = _StubAgent("Alpha", capabilities=["research"])
         default = AgentScore(alignment=0.5, accuracy=0.5, efficiency=0.5)
@@ -62,6 +77,80 @@ def test_upsert_existing_preserves_scores(self, store):
         returned = store.upsert_agent(agent, new_default)
         assert abs(returned.alignment - 0.5) < 0.001
 
+    def test_upsert_fills_null_scores_with_defaults(self, store):
+        agent = _StubAgent("Alpha", capabilities=["research"])
+        with store._connection() as conn:
+            conn.execute(
+                "INSERT INTO agents (name, capabilities, alignment) VALUES (?, ?, ?)",
+                ("Alpha", "[]", 0.75),
+            )
+        returned = store.upsert_agent(agent, AgentScore(0.5, 0.25, 1.0))
+        assert returned == AgentScore(alignment=0.75, accuracy=0.25, efficiency=1.0)
+        assert isinstance(returned.efficiency, float)
+        assert store.load_scores()["Alpha"] == returned
+
+    def test_upsert_agents_batches_and_preserves_scores(self, store, monkeypatch):
+        monkeypatch.setattr(AgentRegistryStore, "_UPSERT_BATCH", 2)
+        default = AgentScore(alignment=0.5, accuracy=0.5, efficiency=0.5)
+        store.upsert_agent(_StubAgent("Alpha", capabilities=["research"]), default)
+        store.update_score("Alpha", AgentScore(0.9, 0.8, 0.7))
+
+        agents = [
+            _StubAgent(name, capabilities=["research"])
+            for name in ("Alpha", "Beta", "Gamma", "Delta", "Epsilon")
+        ]
+        persisted = store.upsert_agents((agent, default) for agent in agents)
+
+        assert set(persisted) == {agent.name for agent in agents}
+        assert persisted["Alpha"] == AgentScore(0.9, 0.8, 0.7)
+        assert persisted["Epsilon"] == default
+        assert store.load_scores() == persisted
+
+    def test_legacy_rowid_table_is_migrated(self, tmp_path):
+        db_path = str(tmp_path / "legacy.db")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE agents (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE NOT NULL,
+                    capabilities TEXT NOT NULL,
+                    description TEXT,
+                    alignment REAL,
+                    accuracy REAL,
+                    efficiency REAL,
+                    created_at TEXT,
+                    updated_at TEXT
+                )
+                """)
+            conn.execute(
+                "INSERT INTO agents (name, capabilities, alignment, accuracy, "
+                "efficiency, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ("Alpha", '["research"]', 0.9, 0.8, 0.7, "1700000000.5", None),
+            )
+        conn.close()
+
+        store = AgentRegistryStore(db_path=db_path)
+        with store._connection() as conn:
+            (table_sql,) = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'agents'"
+            ).fetchone()
+            created_at = conn.execute(
+                "SELECT created_at FROM agents WHERE name = 'Alpha'"
+            ).fetchone()[0]
+        scores = store.load_scores()
+        store.close()
+
+        assert "WITHOUT ROWID" in table_sql
+        assert created_at == 1700000000.5
+        assert scores["Alpha"] == AgentScore(0.9, 0.8, 0.7)
+
+    def test_in_memory_store_keeps_data_between_calls(self):
+        store = AgentRegistryStore(db_path=":memory:")
+        agent = _StubAgent("Alpha", capabilities=["research"])
+        store.upsert_agent(agent, AgentScore(0.5, 0.5, 0.5))
+        assert "Alpha" in store.load_scores()
+        store.close()
+
     def test_update_score(self, store):
         agent = _StubAgent("Alpha", capabilities=["research"])
         default = AgentScore(alignment=0.5, accuracy=0.5, efficiency=0.5)
@@ -85,6 +174,15 @@ def test_register_and_get(self, registry):
         registry.register_agent(agent)
         assert registry.get_agent("Alpha") is agent
 
+    def test_register_agents_batch(self, registry):
+        a1 = _StubAgent("Alpha", capabilities=["research"])
+        a2 = _StubAgent("Beta", capabilities=["code"])
+        registry.register_agent(a1)
+        registry.register_agents([a1, a2, _StubAgent("Beta", capabilities=["x"])])
+        assert registry.get_agent_names() == ["Alpha", "Beta"]
+        assert registry.get_agent("Beta") is a2
+        assert registry.scores["Beta"] == AgentScore(0.5, 0.5, 0.5)
+
     def test_get_nonexistent(self, registry):
         assert registry.get_agent("ghost") is None
 
@@ -123,6 +221,43 @@ def test_route_task_no_capable_agent_raises(self, registry):
         with pytest.raises(ValueError, match="No agent found"):
             registry.route_task({"required_capability": "flying"})
 
+    def test_route_task_ties_follow_registration_order(self, registry):
+        registry.register_agents(
+            _StubAgent(name, capabilities=["research"])
+            for name in ("Alpha", "Beta", "Gamma")
+        )
+        registry.register_agent(_StubAgent("Delta", capabilities=["code"]))
+        assert registry.route_task({"required_capability": "research"}) == "Alpha"
+        assert registry.route_task({"required_capability": "code"}) == "Delta"
+
+    def test_route_task_ignores_agents_removed_from_registry(self, registry):
+        registry.register_agent(_StubAgent("Alpha", capabilities=["research"]))
+        registry.register_agent(_StubAgent("Beta", capabilities=["research"]))
+        registry.agents.clear()
+        registry.register_agent(_StubAgent("Alpha", capabilities=["code"]))
+        with pytest.raises(ValueError, match="No agent found"):
+            registry.route_task({"required_capability": "research"})
+
+    def test_route_task_sees_agents_added_directly(self, registry):
+        registry.register_agent(_StubAgent("Alpha", capabilities=["research"]))
+        registry.agents["Beta"] = _StubAgent("Beta", capabilities=["research"])
+        registry.scores["Beta"] = AgentScore(
+            alignment=1.0, accuracy=1.0, efficiency=1.0
+        )
+        assert registry.route_task({"required_capability": "research"}) == "Beta"
+
+        registry.agents["Gamma"] = _StubAgent("Gamma", capabilities=["code"])
+        registry.scores["Gamma"] = AgentScore(
+            alignment=0.5, accuracy=0.5, efficiency=0.5
+        )
+        assert registry.route_task({"required_capability": "code"}) == "Gamma"
+
+    def test_route_task_sees_capabilities_added_after_registration(self, registry):
+        agent = _StubAgent("Alpha", capabilities=["research"])
+        registry.register_agent(agent)
+        agent.capabilities.append("code")
+        assert registry.route_task({"required_capability": "code"}) == "Alpha"
+
     def test_update_score_dimension(self, registry):
         agent = _StubAgent("Alpha", capabilities=["research"])
         registry.register_agent(agent)
@@ -131,6 +266,69 @@ def test_update_score_dimension(self, registry):
         new = registry.scores["Alpha"].alignment
         assert abs(new - (old + 0.2)) < 0.001
 
+    def test_update_score_writes_back_on_flush(self, tmp_path):
+        db_path = str(tmp_path / "registry.db")
+        registry = AgentRegistry(db_path=db_path, score_flush_interval=3600)
+        registry.register_agent(_StubAgent("Alpha", capabilities=["research"]))
+
+        registry.update_score("Alpha", "alignment", 0.2)
+        registry.update_score("Alpha", "accuracy", -0.1)
+        assert abs(registry.store.load_scores()["Alpha"].alignment - 0.5) < 0.001
+
+        registry.flush_scores()
+        persisted = registry.store.load_scores()["Alpha"]
+        assert abs(persisted.alignment - 0.7) < 0.001
+        assert abs(persisted.accuracy - 0.4) < 0.001
+
+        registry.update_score("Alpha", "efficiency", 0.3)
+        registry.close()
+        reopened = AgentRegistryStore(db_path=db_path)
+        assert abs(reopened.load_scores()["Alpha"].efficiency - 0.8) < 0.001
+        reopened.close()
+
+    def test_background_flusher_persists_scores(self, tmp_path):
+        registry = AgentRegistry(
+            db_path=str(tmp_path / "registry.db"), score_flush_interval=0.01
+        )
+        registry.register_agent(_StubAgent("Alpha", capabilities=["research"]))
+        registry.update_score("Alpha", "alignment", 0.2)
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if abs(registry.store.load_scores()["Alpha"].alignment - 0.7) < 0.001:
+                break
+            time.sleep(0.01)
+        else:
+            pytest.fail("score was not flushed in the background")
+        registry.close()
+
+    def test_background_flusher_retries_after_error(self, tmp_path, monkeypatch):
+        registry = AgentRegistry(
+            db_path=str(tmp_path / "registry.db"), score_flush_interval=0.01
+        )
+        registry.register_agent(_StubAgent("Alpha", capabilities=["research"]))
+        real_update_scores = registry.store.update_scores
+        calls = []
+
+        def _locked_once(scores):
+            calls.append(scores)
+            if len(calls) == 1:
+                raise sqlite3.OperationalError("database is locked")
+            real_update_scores(scores)
+
+        monkeypatch.setattr(registry.store, "update_scores", _locked_once)
+        registry.update_score("Alpha", "alignment", 0.2)
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if abs(registry.store.load_scores()["Alpha"].alignment - 0.7) < 0.001:
+                break
+            time.sleep(0.01)
+        else:
+            pytest.fail("score was not retried after the failed flush")
+        assert registry._flusher.is_alive()
+        registry.close()
+
     def test_update_score_clamps_to_one(self, registry):
         agent = _StubAgent("Alpha", capabilities=["research"])
         registry.register_agent(agent)
@@ -249,6 +249,17 @@ def test_is_atp_formatted_helper(self, parser):
         assert parser.is_atp_formatted("#Mode: Build") is True
         assert parser.is_atp_formatted("plain text") is False
 
+    def test_plain_text_skips_header_regexes(self, parser, monkeypatch):
+        """Input without '#' or '[[' never reaches the header regexes."""
+
+        def _fail(*_args):
+            raise AssertionError("header regex should not run")
+
+        monkeypatch.setattr(parser, "_extract_headers", _fail)
+        message = parser.parse("  just a plain note  ")
+        assert message.content == "just a plain note"
+        assert parser.detect_format("just a plain note") is None
+
     def test_parse_enum_name_fallback_and_default(self, parser):
         """_parse_enum handles name lookup and default fallback."""
 
@@ -259,6 +270,20 @@ class _Dummy(Enum):
         assert parser._parse_enum("RED", _Dummy, _Dummy.BLUE) == _Dummy.RED
         assert parser._parse_enum("unknown", _Dummy, _Dummy.BLUE) == _Dummy.BLUE
 
+    def test_enum_headers_case_insensitive_with_defaults(self, parser):
+        """Header enums match value or name in any case, else fall back."""
+        message = parser.parse(
+            "#Mode: synthesize\n#Priority: LOW\n#ActionType: scaffold\nbody"
+        )
+        assert message.mode == ATPMode.SYNTHESIZE
+        assert message.priority == ATPPriority.LOW
+        assert message.action_type == ATPActionType.SCAFFOLD
+
+        message = parser.parse("#Mode: Dance\n#Priority: Whenever\n#ActionType: ?\n")
+        assert message.mode == ATPMode.UNKNOWN
+        assert message.priority == ATPPriority.NORMAL
+        assert message.action_type == ATPActionType.UNKNOWN
+
     def test_parse_with_metrics_re_raises_parse_errors(self, parser, monkeypatch):
         """Errors in parse() are surfaced to callers."""
         monkeypatch.setattr(
@@ -61,6 +61,11 @@ def test_report_status(self, agent):
     def test_logger_property(self, agent):
         assert agent.logger is not None
 
+    def test_logger_shared_by_agents_with_same_name(self, agent):
+        other = _ConcreteAgent("Bot")
+        assert other.logger is agent.logger
+        assert agent.logger.name.endswith(".Bot")
+
     def test_repr(self, agent):
         r = repr(agent)
         assert "Bot" in r
@@ -70,6 +70,7 @@ def test_get_recent_events_limit(self, monitor):
 
     def test_persist_writes_jsonl(self, monitor, tmp_path):
         monitor.record_failure({"error": "disk full"})
+        monitor.flush()
         log_file = tmp_path / "governance" / "events.log"
         assert log_file.exists()
         lines = log_file.read_text().strip().split("\n")
@@ -85,6 +86,7 @@ def _raise(*args, **kwargs):
         monkeypatch.setattr(Path, "open", _raise)
         # Should not raise
         monitor.record_failure({"error": "e1"})
+        monitor.flush()
         assert monitor.get_failure_streak() == 1
 
     def test_original_event_not_mutated(self, monitor):
@@ -105,3 +107,74 @@ def test_continued_failures_past_threshold(self, monitor):
         events = monitor.get_recent_events()
         alerts = [e for e in events if e.get("type") == "governance_alert"]
         assert len(alerts) == 3  # alerts at streak 3, 4, 5
+
+    def test_event_history_is_bounded(self, tmp_path):
+        m = GovernanceMonitor(
+            alert_threshold=100, log_path=str(tmp_path / "e.log"), max_events=5
+        )
+        for i in range(12):
+            m.record_failure({"error": f"e{i}"})
+        events = m.get_recent_events()
+        assert [e["error"] for e in events] == [f"e{i}" for i in range(7, 12)]
+        assert [e["error"] for e in m.get_recent_events(limit=2)] == ["e10", "e11"]
+        # The JSONL log still keeps every event
+        m.flush()
+        assert len((tmp_path / "e.log").read_text().splitlines()) == 12
+
+    def test_persist_does_not_block_on_io(self, tmp_path):
+        m = GovernanceMonitor(alert_threshold=100, log_path=str(tmp_path / "e.log"))
+        for i in range(50):
+            m.record_failure({"error": f"e{i}"})
+        m.flush()
+        lines = (tmp_path / "e.log").read_text().splitlines()
+        assert [json.loads(line)["error"] for line in lines] == [
+            f"e{i}" for i in range(50)
+        ]
+
+    def test_log_file_opened_once(self, tmp_path, monkeypatch):
+        m = GovernanceMonitor(alert_threshold=100, log_path=str(tmp_path / "e.log"))
+        opens = []
+        real_open = Path.open
+
+        def _counting_open(self, mode="r", *args, **kwargs):
+            if mode == "a":
+                opens.append(self)
+            return real_open(self, mode, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "open", _counting_open)
+        for i in range(3):
+            m.record_failure({"error": f"e{i}"})
+            m.flush()
+        # Each flushed batch is already visible on disk
+        assert len((tmp_path / "e.log").read_text().splitlines()) == 3
+        m.close()
+        assert len(opens) == 1
+        assert m._log_file is None
+
+    def test_writer_survives_write_error(self, tmp_path, monkeypatch):
+        m = GovernanceMonitor(alert_threshold=100, log_path=str(tmp_path / "e.log"))
+        real_open = Path.open
+        failures = []
+
+        class _ClosedFile:
+            def writelines(self, lines):
+                failures.append(lines)
+                raise ValueError("I/O operation on closed file")
+
+            def close(self):
+                pass
+
+        def _failing_once_open(self, mode="r", *args, **kwargs):
+            if mode == "a" and not failures:
+                return _ClosedFile()
+            return real_open(self, mode, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "open", _failing_once_open)
+        m.record_failure({"error": "lost"})
+        m.flush()
+        m.record_failure({"error": "kept"})
+        m.close()
+
+        assert len(failures) == 1
+        lines = (tmp_path / "e.log").read_text().splitlines()
+        assert [json.loads(line)["error"] for line in lines] == ["kept"]
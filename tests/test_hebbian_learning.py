@@ -3,7 +3,9 @@
 """
 
 import os
+import sys
 import tempfile
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -18,9 +20,10 @@ def temp_db():
 
     yield db_path
 
-    # Cleanup
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    # Cleanup (including WAL side files)
+    for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 @pytest.fixture
@@ -38,6 +41,29 @@ def test_initialization(self, hebbian_manager):
         summary = hebbian_manager.get_network_summary()
         assert summary["total_connections"] == 0
 
+    def test_database_uses_wal_journal(self, hebbian_manager):
+        """Test that the weights database is switched to WAL mode."""
+        with hebbian_manager._connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        assert mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+    def test_shared_connection_across_threads(self, hebbian_manager):
+        """Test that concurrent updates through one connection are not lost."""
+
+        def worker():
+            for _ in range(25):
+                hebbian_manager.strengthen_connection("agent_a", "task_1")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert hebbian_manager.get_weight("agent_a", "task_1") == 100.0
+
     def test_strengthen_connection_new(self, hebbian_manager):
         """Test strengthening a new connection."""
         weight = hebbian_manager.strengthen_connection("agent_a", "task_1")
@@ -68,12 +94,51 @@ def test_weaken_connection_minimum_zero(self, hebbian_manager):
         weight = hebbian_manager.weaken_connection("agent_a", "task_1")
         assert weight == 0.0
 
+    def test_new_connection_timestamps_match(self, hebbian_manager):
+        """Test a single timestamp is used for created_at and last_updated."""
+        hebbian_manager.strengthen_connection("agent_a", "task_1")
+        hebbian_manager.weaken_connection("agent_a", "task_2")
+        for target in ("task_1", "task_2"):
+            stats = hebbian_manager.get_connection_stats("agent_a", target)
+            assert stats["created_at"] == stats["last_updated"]
+
     def test_get_weight(self, hebbian_manager):
         """Test getting connection weight."""
         assert hebbian_manager.get_weight("agent_a", "task_1") == 0.0
         hebbian_manager.strengthen_connection("agent_a", "task_1")
         assert hebbian_manager.get_weight("agent_a", "task_1") == 1.0
 
+    def test_get_weight_after_reload_prune_and_reset(self, hebbian_manager, temp_db):
+        """Test get_weight reflects reopened, pruned and reset connections."""
+        hebbian_manager.strengthen_connection("agent_a", "task_1")
+        hebbian_manager.bulk_update([("agent_b", "task_2", 1)])
+        assert hebbian_manager.get_weight("agent_a", "task_9") == 0.0
+
+        reopened = HebbianWeightManager(db_path=temp_db)
+        try:
+            assert reopened.get_weight("agent_b", "task_2") == 1.0
+        finally:
+            reopened.close()
+
+        hebbian_manager.weaken_connection("agent_b", "task_2")
+        assert hebbian_manager.prune_weak_connections(threshold=0) == 1
+        assert hebbian_manager.get_weight("agent_b", "task_2") == 0.0
+        assert hebbian_manager.get_weight("agent_a", "task_1") == 1.0
+        hebbian_manager.reset_weights()
+        assert hebbian_manager.get_weight("agent_a", "task_1") == 0.0
+
+    def test_get_weight_sees_edges_from_other_manager(self, hebbian_manager, temp_db):
+        """Test edges committed by another manager on the same file are seen."""
+        assert hebbian_manager.get_weight("agent_a", "task_1") == 0.0
+
+        other = HebbianWeightManager(db_path=temp_db)
+        try:
+            other.strengthen_connection("agent_a", "task_1")
+        finally:
+            other.close()
+
+        assert hebbian_manager.get_weight("agent_a", "task_1") == 1.0
+
     def test_get_connection_stats(self, hebbian_manager):
         """Test getting detailed connection statistics."""
         hebbian_manager.strengthen_connection("agent_a", "task_1")
@@ -111,6 +176,45 @@ def test_get_strongest_connections_incoming(self, hebbian_manager):
         assert connections[0] == ("agent_b", 2.0)
         assert connections[1] == ("agent_a", 1.0)
 
+    def test_strongest_connections_use_composite_indexes(self, hebbian_manager):
+        """Test per-node top-k lookups are served by a sorted index."""
+        queries = {
+            "idx_origin_weight": "WHERE origin_node = ?",
+            "idx_target_weight": "WHERE target_node = ?",
+        }
+        with hebbian_manager._connection() as conn:
+            for index_name, where in queries.items():
+                plan = " ".join(
+                    row[-1]
+                    for row in conn.execute(
+                        "EXPLAIN QUERY PLAN SELECT weight FROM node_connections "
+                        f"{where} ORDER BY weight DESC LIMIT 10",
+                        ("agent_a",),
+                    )
+                )
+                assert index_name in plan
+                assert "TEMP B-TREE" not in plan
+
+    def test_no_redundant_origin_index(self, hebbian_manager):
+        """Test origin lookups reuse the composite index instead of idx_origin."""
+        with hebbian_manager._connection() as conn:
+            indexes = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+            plan = " ".join(
+                row[-1]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT AVG(weight) FROM node_connections "
+                    "WHERE origin_node = ?",
+                    ("agent_a",),
+                )
+            )
+        assert "idx_origin" not in indexes
+        assert "COVERING INDEX idx_origin_weight" in plan
+
     def test_get_agent_average_weight(self, hebbian_manager):
         """Test calculating agent average weight."""
         hebbian_manager.strengthen_connection("agent_a", "task_1")
@@ -129,6 +233,28 @@ def test_get_agent_success_rate(self, hebbian_manager):
         success_rate = hebbian_manager.get_agent_success_rate("agent_a")
         assert success_rate == 2.0 / 3.0  # 2 successes out of 3 activations
 
+    def test_get_agent_stats_matches_individual_queries(self, hebbian_manager):
+        """Test the fused per-agent aggregate matches the separate queries."""
+        hebbian_manager.strengthen_connection("agent_a", "task_1")
+        hebbian_manager.strengthen_connection("agent_a", "task_1")
+        hebbian_manager.weaken_connection("agent_a", "task_2")
+        hebbian_manager.strengthen_connection("agent_b", "task_3")
+
+        stats = hebbian_manager.get_agent_stats("agent_a")
+
+        assert stats["connections"] == 2
+        assert stats["average_weight"] == hebbian_manager.get_agent_average_weight(
+            "agent_a"
+        )
+        assert stats["success_rate"] == hebbian_manager.get_agent_success_rate(
+            "agent_a"
+        )
+        assert hebbian_manager.get_agent_stats("unknown") == {
+            "connections": 0,
+            "average_weight": 0.0,
+            "success_rate": 0.0,
+        }
+
     def test_get_network_summary(self, hebbian_manager):
         """Test getting network summary statistics."""
         hebbian_manager.strengthen_connection("agent_a", "task_1")
@@ -143,6 +269,33 @@ def test_get_network_summary(self, hebbian_manager):
         assert summary["total_failures"] == 1
         assert summary["success_rate"] == 2.0 / 3.0
 
+    def test_get_all_connections_and_list(self, hebbian_manager):
+        """Test connection exports return plain dicts ordered by weight."""
+        hebbian_manager.strengthen_connection("agent_a", "task_1")
+        hebbian_manager.strengthen_connection("agent_a", "task_1")
+        hebbian_manager.weaken_connection("agent_a", "task_2")
+        hebbian_manager.strengthen_connection("agent_b", "task_3")
+
+        everything = hebbian_manager.get_all_connections()
+        assert [c["target_node"] for c in everything] == ["task_1", "task_3", "task_2"]
+        assert everything[0]["success_count"] == 2
+        assert "created_at" in everything[0]
+        assert len(hebbian_manager.get_all_connections(min_weight=1)) == 2
+
+        listed = hebbian_manager.get_connections_list(limit=2)
+        assert len(listed) == 2
+        assert listed[0] == {
+            "origin_node": "agent_a",
+            "target_node": "task_1",
+            "weight": 2.0,
+            "activation_count": 2,
+            "success_count": 2,
+            "failure_count": 0,
+            "success_rate": 1.0,
+        }
+        weakened = hebbian_manager.get_connections_list()[-1]
+        assert weakened["success_rate"] == 0.0
+
     def test_prune_weak_connections(self, hebbian_manager):
         """Test pruning connections below threshold."""
         hebbian_manager.strengthen_connection("agent_a", "task_1")
@@ -184,6 +337,70 @@ def test_multiple_activations_tracking(self, hebbian_manager):
         assert stats["failure_count"] == 1
         assert stats["weight"] == 2.0  # 3 successes - 1 failure
 
+    def test_strengthen_many_matches_individual_updates(self, hebbian_manager):
+        """Test that batched strengthening matches per-call updates."""
+        count = hebbian_manager.strengthen_many(
+            [("agent_a", "task_1"), ("agent_a", "task_1"), ("agent_b", "task_2")]
+        )
+
+        assert count == 3
+        assert hebbian_manager.get_weight("agent_a", "task_1") == 2.0
+        assert hebbian_manager.get_weight("agent_b", "task_2") == 1.0
+        stats = hebbian_manager.get_connection_stats("agent_a", "task_1")
+        assert stats["activation_count"] == 2
+        assert stats["success_count"] == 2
+
+    def test_weaken_many_floors_at_zero(self, hebbian_manager):
+        """Test that batched weakening counts failures and floors weights."""
+        hebbian_manager.strengthen_connection("agent_a", "task_1")
+        count = hebbian_manager.weaken_many(
+            [("agent_a", "task_1"), ("agent_a", "task_1"), ("agent_c", "task_3")]
+        )
+
+        assert count == 3
+        assert hebbian_manager.get_weight("agent_a", "task_1") == 0.0
+        stats = hebbian_manager.get_connection_stats("agent_c", "task_3")
+        assert stats["weight"] == 0.0
+        assert stats["failure_count"] == 1
+        assert stats["success_count"] == 0
+
+    def test_bulk_update_mixed_deltas(self, hebbian_manager):
+        """Test bulk_update applies signed deltas in order."""
+        count = hebbian_manager.bulk_update(
+            [
+                ("agent_a", "task_1", 1),
+                ("agent_a", "task_1", 1),
+                ("agent_a", "task_1", -1),
+            ]
+        )
+
+        assert count == 3
+        assert hebbian_manager.bulk_update([]) == 0
+        stats = hebbian_manager.get_connection_stats("agent_a", "task_1")
+        assert stats["weight"] == 1.0
+        assert stats["activation_count"] == 3
+        assert stats["success_count"] == 2
+        assert stats["failure_count"] == 1
+
+    def test_updates_log_old_and_new_weights(self, hebbian_manager, monkeypatch):
+        """Test old weights are derived from the single UPSERT result."""
+        logged = []
+
+        class _Recorder:
+            def log_hebbian_update(self, **kwargs):
+                logged.append((kwargs["old_weight"], kwargs["new_weight"]))
+
+        module = sys.modules[type(hebbian_manager).__module__]
+        monkeypatch.setattr(module, "_get_run_logger", lambda: _Recorder())
+
+        hebbian_manager.strengthen_connection("agent_a", "task_1")
+        hebbian_manager.strengthen_connection("agent_a", "task_1")
+        hebbian_manager.weaken_connection("agent_a", "task_1")
+        hebbian_manager.weaken_connection("agent_a", "task_2")
+
+        assert logged == [(0.0, 1.0), (1.0, 2.0), (2.0, 1.0), (0.0, 0.0)]
+        assert all(isinstance(new, float) for _, new in logged)
+
 
 @pytest.mark.integration
 class TestHebbianIntegration:
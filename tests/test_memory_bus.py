@@ -54,15 +54,18 @@ def read_note(self, *args, **kwargs):
             return None
 
     vector_store = MagicMock()
-    vector_store.upsert = MagicMock()
-    vector_store.delete = MagicMock()
+    vector_store.stage = MagicMock()
+    vector_store.commit = MagicMock()
+    vector_store.discard = MagicMock()
 
     bus = MemoryBus(FailingManager(tmp_path), vector_store)
 
     with pytest.raises(IOError):
         bus.write_note_with_embedding("note.md", "content")
 
-    vector_store.delete.assert_called_once()
+    vector_store.discard.assert_called_once_with("note.md")
+    vector_store.commit.assert_not_called()
+    vector_store.delete.assert_not_called()
 
 
 def test_governance_alert_on_repeated_failures(tmp_path):
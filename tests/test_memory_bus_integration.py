@@ -1,5 +1,6 @@
 """Tests for the memory bus (src/integration/memory_bus.py)."""
 
+import os
 import sys
 
 sys.modules.pop("integration.memory_bus", None)
@@ -38,10 +39,23 @@ class _StubVectorStore:
     def __init__(self):
         self.docs = {}
         self.deleted = []
+        self.staged = {}
+        self.discarded = []
 
     def upsert(self, doc_id, content, metadata=None):
         self.docs[doc_id] = (content, metadata)
 
+    def stage(self, doc_id, content, metadata=None):
+        self.staged[doc_id] = (content, metadata)
+
+    def commit(self, doc_id):
+        self.docs[doc_id] = self.staged.pop(doc_id)
+        return True
+
+    def discard(self, doc_id):
+        self.discarded.append(doc_id)
+        return self.staged.pop(doc_id, None) is not None
+
     def delete(self, doc_id):
         self.deleted.append(doc_id)
         self.docs.pop(doc_id, None)
@@ -120,9 +134,20 @@ def test_obsidian_failure_rolls_back_vector(self):
         bus = MemoryBus(obsidian_manager=obs, vector_store=vec)
         with pytest.raises(OSError):
             bus.write_note_with_embedding("notes/test.md", "content")
-        # Vector store should have rolled back
+        # Staged embedding is dropped without touching the stored documents
         assert "notes/test.md" not in vec.docs
-        assert "notes/test.md" in vec.deleted
+        assert "notes/test.md" in vec.discarded
+        assert vec.staged == {}
+        assert vec.deleted == []
+
+    def test_obsidian_failure_keeps_previous_vector(self):
+        obs = _FailingObsidianManager()
+        vec = _StubVectorStore()
+        vec.upsert("notes/test.md", "old content", {"path": "notes/test.md"})
+        bus = MemoryBus(obsidian_manager=obs, vector_store=vec)
+        with pytest.raises(OSError):
+            bus.write_note_with_embedding("notes/test.md", "new content")
+        assert vec.docs["notes/test.md"][0] == "old content"
 
     def test_obsidian_failure_records_governance(self):
         obs = _FailingObsidianManager()
@@ -141,6 +166,7 @@ def test_no_embed_no_rollback_on_failure(self):
         with pytest.raises(OSError):
             bus.write_note_with_embedding("notes/test.md", "content", embed=False)
         assert vec.deleted == []
+        assert vec.discarded == []
 
 
 class TestMemoryBusRead:
@@ -196,6 +222,80 @@ def test_keyword_scan(self, tmp_path):
         assert len(keyword_hits) == 1
         assert "notes/a.md" in keyword_hits[0]["path"]
 
+    def test_keyword_scan_is_case_insensitive_across_chunks(
+        self, tmp_path, monkeypatch
+    ):
+        vault = tmp_path / "vault"
+        folder = vault / "notes"
+        folder.mkdir(parents=True)
+        (folder / "a.md").write_text("x" * 10 + "Memory BUS" + "y" * 10)
+        (folder / "b.md").write_text("memory" + "z" * 30)
+
+        obs = _StubObsidianManager(vault_path=str(vault))
+        bus = MemoryBus(
+            obsidian_manager=obs, vector_store=_StubVectorStore(), search_dirs=["notes"]
+        )
+        # Force the match in a.md to straddle a chunk boundary
+        monkeypatch.setattr(MemoryBus, "_SCAN_CHUNK_BYTES", 14)
+        hits = bus._keyword_scan("memory bus", 5)
+        assert [h["path"] for h in hits] == [str(Path("notes") / "a.md")]
+        assert hits[0]["content"] == "x" * 10 + "Memory BUS" + "y" * 10
+
+    def test_keyword_scan_non_ascii_query(self, tmp_path):
+        vault = tmp_path / "vault"
+        folder = vault / "notes"
+        folder.mkdir(parents=True)
+        (folder / "a.md").write_text("Notes on CAFÉ culture", encoding="utf-8")
+
+        obs = _StubObsidianManager(vault_path=str(vault))
+        bus = MemoryBus(
+            obsidian_manager=obs, vector_store=_StubVectorStore(), search_dirs=["notes"]
+        )
+        hits = bus._keyword_scan("café", 5)
+        assert len(hits) == 1
+
+    def test_keyword_scan_stops_at_limit_in_folder_order(self, tmp_path):
+        vault = tmp_path / "vault"
+        for folder in ("first", "second"):
+            (vault / folder).mkdir(parents=True)
+            for i in range(5):
+                (vault / folder / f"n{i}.md").write_text(f"{folder} note {i}: match")
+
+        obs = _StubObsidianManager(vault_path=str(vault))
+        bus = MemoryBus(
+            obsidian_manager=obs,
+            vector_store=_StubVectorStore(),
+            search_dirs=["first", "second"],
+        )
+        hits = bus._keyword_scan("MATCH", 7)
+        assert len(hits) == 7
+        folders = [Path(h["path"]).parts[0] for h in hits]
+        assert folders == ["first"] * 5 + ["second"] * 2
+
+    def test_note_listing_cached_until_a_directory_changes(self, tmp_path):
+        vault = tmp_path / "vault"
+        nested = vault / "notes" / "nested"
+        nested.mkdir(parents=True)
+        (vault / "notes" / "a.md").write_text("alpha")
+        (nested / "b.md").write_text("beta")
+        (nested / "skip.txt").write_text("not a note")
+        for directory in (vault / "notes", nested):
+            os.utime(directory, (1_000_000, 1_000_000))
+
+        obs = _StubObsidianManager(vault_path=str(vault))
+        bus = MemoryBus(
+            obsidian_manager=obs, vector_store=_StubVectorStore(), search_dirs=["notes"]
+        )
+        first = bus._list_notes(vault / "notes")
+        assert sorted(p.name for p in first) == ["a.md", "b.md"]
+        assert bus._list_notes(vault / "notes") is first
+
+        # A note added in a nested folder only bumps that folder's mtime
+        (nested / "c.md").write_text("gamma")
+        refreshed = bus._list_notes(vault / "notes")
+        assert sorted(p.name for p in refreshed) == ["a.md", "b.md", "c.md"]
+        assert len(bus._keyword_scan("gamma", 5)) == 1
+
     def test_keyword_scan_no_vault_path(self):
         obs = _StubObsidianManager(vault_path=None)
         vec = _StubVectorStore()
@@ -238,3 +338,37 @@ def test_spaces_replaced(self):
 
     def test_no_spaces(self):
         assert MemoryBus._normalize_doc_id("note.md") == "note.md"
+
+
+class TestMemoryBusRunLogger:
+    class _Recorder:
+        def __init__(self, enabled):
+            self.enabled = enabled
+            self.operations = []
+
+        def enabled_for(self, event_type):
+            return event_type in self.enabled
+
+        def log_memory_bus_operation(self, operation, **kwargs):
+            self.operations.append(operation)
+
+    def _bus(self, monkeypatch, recorder):
+        module = sys.modules[MemoryBus.__module__]
+        monkeypatch.setattr(module, "_get_run_logger", lambda: recorder)
+        return MemoryBus(
+            obsidian_manager=_StubObsidianManager(), vector_store=_StubVectorStore()
+        )
+
+    def test_enabled_events_are_logged(self, monkeypatch):
+        recorder = self._Recorder({"memory_bus_write", "memory_bus_read"})
+        bus = self._bus(monkeypatch, recorder)
+        bus.write_note_with_embedding("notes/test.md", "content")
+        bus.read("query")
+        assert recorder.operations == ["write", "read"]
+
+    def test_disabled_events_are_skipped(self, monkeypatch):
+        recorder = self._Recorder({"memory_bus_read"})
+        bus = self._bus(monkeypatch, recorder)
+        bus.write_note_with_embedding("notes/test.md", "content")
+        bus.read("query")
+        assert recorder.operations == ["read"]
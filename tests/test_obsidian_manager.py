@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from src.obsidian_integration.manager import ObsidianManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ObsidianManager(vault_path=str(tmp_path))
+
+
+def test_write_note_overwrites_atomically(manager, tmp_path):
+    manager.write_note("Agent Inputs/task.md", "first version")
+    manager.write_note("Agent Inputs/task.md", "second")
+
+    assert manager.read_note("Agent Inputs/task.md") == "second"
+    # No temporary files are left next to the note
+    assert os.listdir(tmp_path / "Agent Inputs") == ["task.md"]
+
+
+def test_write_note_failure_keeps_original(manager, tmp_path, monkeypatch):
+    manager.write_note("task.md", "original")
+
+    def _fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", _fail)
+    with pytest.raises(OSError):
+        manager.write_note("task.md", "replacement")
+
+    assert manager.read_note("task.md") == "original"
+    assert os.listdir(tmp_path) == ["task.md"]
+
+
+def test_write_note_append(manager):
+    manager.write_note("log.md", "a")
+    manager.write_note("log.md", "b", overwrite=False)
+
+    assert manager.read_note("log.md") == "ab"
+    assert manager.list_notes_in_folder(".") == ["log.md"]
+
+
+def test_get_note_fingerprint_tracks_changes(manager):
+    assert manager.get_note_fingerprint("missing.md") is None
+
+    manager.write_note("task.md", "status: pending")
+    first = manager.get_note_fingerprint("task.md")
+    manager.write_note("task.md", "status: completed")
+
+    assert first is not None
+    assert manager.get_note_fingerprint("task.md") != first
@@ -22,15 +22,22 @@ def test_defaults(self):
 
     def test_add_context(self):
         node = ConceptNode(concept="memory")
-        node.add_context("we discussed memory")
+        node.add_context(0)
         assert node.frequency == 1
         assert len(node.contexts) == 1
 
+    def test_add_context_updates_importance(self):
+        node = ConceptNode(concept="memory")
+        node.add_context(0)
+        first = node.importance_score
+        node.add_context(1)
+        assert 0.0 < first < node.importance_score < 1.0
+
     def test_multiple_contexts(self):
         node = ConceptNode(concept="agents")
-        node.add_context("ctx1")
-        node.add_context("ctx2")
-        node.add_context("ctx3")
+        node.add_context(0)
+        node.add_context(1)
+        node.add_context(2)
         assert node.frequency == 3
 
     def test_relate_to(self):
@@ -56,31 +63,31 @@ def graph(self):
         return ConceptGraph()
 
     def test_add_concept_new(self, graph):
-        graph.add_concept("Memory", "context about memory")
+        graph.add_concept("Memory", 0)
         assert "memory" in graph.concepts
         assert graph.concepts["memory"].frequency == 1
 
     def test_add_concept_existing(self, graph):
-        graph.add_concept("Memory", "ctx1")
-        graph.add_concept("memory", "ctx2")  # same concept, different case
+        graph.add_concept("Memory", 0)
+        graph.add_concept("memory", 1)  # same concept, different case
         assert graph.concepts["memory"].frequency == 2
 
     def test_relate_concepts(self, graph):
-        graph.add_concept("Memory", "ctx")
-        graph.add_concept("Vector", "ctx")
+        graph.add_concept("Memory", 0)
+        graph.add_concept("Vector", 0)
         graph.relate_concepts("Memory", "Vector")
         assert "vector" in graph.concepts["memory"].related_concepts
         assert "memory" in graph.concepts["vector"].related_concepts
         assert len(graph.concept_pairs) == 1
 
     def test_relate_nonexistent_concepts(self, graph):
-        graph.add_concept("Memory", "ctx")
+        graph.add_concept("Memory", 0)
         graph.relate_concepts("Memory", "Nonexistent")
         assert len(graph.concept_pairs) == 0
 
     def test_get_top_concepts(self, graph):
         for word in ["alpha", "beta", "gamma"]:
-            graph.add_concept(word, "ctx")
+            graph.add_concept(word, 0)
         # Boost gamma
         graph.concepts["gamma"].importance_score = 1.0
         top = graph.get_top_concepts(2)
@@ -88,17 +95,28 @@ def test_get_top_concepts(self, graph):
         assert top[0].concept == "gamma"
 
     def test_get_top_concepts_by_frequency(self, graph):
-        graph.add_concept("rare", "ctx1")
-        graph.add_concept("common", "ctx1")
-        graph.add_concept("common", "ctx2")
-        graph.add_concept("common", "ctx3")
+        graph.add_concept("rare", 0)
+        graph.add_concept("common", 0)
+        graph.add_concept("common", 1)
+        graph.add_concept("common", 2)
         top = graph.get_top_concepts(1)
         assert top[0].concept == "common"
 
+    def test_get_top_concepts_ties_keep_insertion_order(self, graph):
+        for word in ["delta", "alpha", "omega", "beta"]:
+            graph.add_concept(word, 0)
+        graph.add_concept("omega", 1)
+        top = graph.get_top_concepts(3)
+        assert [c.concept for c in top] == ["omega", "delta", "alpha"]
+
+    def test_get_top_concepts_n_exceeds_size(self, graph):
+        graph.add_concept("only", 0)
+        assert [c.concept for c in graph.get_top_concepts(10)] == ["only"]
+
     def test_find_concept_clusters_connected(self, graph):
-        graph.add_concept("A", "ctx")
-        graph.add_concept("B", "ctx")
-        graph.add_concept("C", "ctx")
+        graph.add_concept("A", 0)
+        graph.add_concept("B", 0)
+        graph.add_concept("C", 0)
         graph.relate_concepts("A", "B")
         graph.relate_concepts("B", "C")
         clusters = graph.find_concept_clusters()
@@ -106,17 +124,28 @@ def test_find_concept_clusters_connected(self, graph):
         assert clusters[0] == {"a", "b", "c"}
 
     def test_find_concept_clusters_disjoint(self, graph):
-        graph.add_concept("A", "ctx")
-        graph.add_concept("B", "ctx")
-        graph.add_concept("C", "ctx")
-        graph.add_concept("D", "ctx")
+        graph.add_concept("A", 0)
+        graph.add_concept("B", 0)
+        graph.add_concept("C", 0)
+        graph.add_concept("D", 0)
         graph.relate_concepts("A", "B")
         graph.relate_concepts("C", "D")
         clusters = graph.find_concept_clusters()
         assert len(clusters) == 2
 
+    def test_find_concept_clusters_long_chain(self, graph):
+        # Deeper than the default recursion limit.
+        keys = [f"c{i}" for i in range(sys.getrecursionlimit() + 100)]
+        for key in keys:
+            graph.add_concept(key, 0)
+        for a, b in zip(keys, keys[1:]):
+            graph.relate_concepts(a, b)
+        clusters = graph.find_concept_clusters()
+        assert len(clusters) == 1
+        assert clusters[0] == set(keys)
+
     def test_find_concept_clusters_singletons_excluded(self, graph):
-        graph.add_concept("Alone", "ctx")
+        graph.add_concept("Alone", 0)
         clusters = graph.find_concept_clusters()
         assert len(clusters) == 0
 
@@ -143,6 +172,13 @@ def test_add_conversation_tracks_history(self, engine):
         engine.add_conversation("second")
         assert len(engine.conversation_history) == 2
 
+    def test_add_conversation_records_conversation_ids(self, engine):
+        engine.add_conversation("memory systems")
+        engine.add_conversation("memory recall")
+        node = engine.concept_graph.concepts["memory"]
+        assert node.contexts == [0, 1]
+        assert engine.conversation_history[node.contexts[1]] == "memory recall"
+
     def test_concept_extraction_filters_stopwords(self, engine):
         concepts = engine._extract_concepts("the and of to a in for is on with")
         assert concepts == []
@@ -155,6 +191,10 @@ def test_concept_extraction_deduplicates(self, engine):
         concepts = engine._extract_concepts("agent agent agent different")
         assert concepts.count("agent") == 1
 
+    def test_concept_extraction_preserves_first_seen_order(self, engine):
+        concepts = engine._extract_concepts("vector, memory; vector graph memory")
+        assert concepts == ["vector", "memory", "graph"]
+
     def test_relationship_identification(self, engine):
         engine.add_conversation("memory and vector are closely related")
         # memory and vector should be related (within 50 chars)
@@ -162,6 +202,26 @@ def test_relationship_identification(self, engine):
         if mem_node:
             assert "vector" in mem_node.related_concepts
 
+    def test_relationship_requires_proximity(self, engine):
+        engine.add_conversation("memory " + "x " * 40 + "vector")
+        assert "vector" not in engine.concept_graph.concepts["memory"].related_concepts
+
+    def test_relationship_detected_in_either_order(self, engine):
+        engine.add_conversation("vector search " + "x " * 40 + "memory vector")
+        assert "vector" in engine.concept_graph.concepts["memory"].related_concepts
+        assert "search" not in engine.concept_graph.concepts["memory"].related_concepts
+
+    def test_relationship_uses_any_occurrence_in_window(self, engine):
+        # First "vector" is far from "graph"; a later occurrence is close.
+        engine.add_conversation(
+            "vector " + "x " * 40 + "memory " + "x " * 40 + "graph vector"
+        )
+        assert "vector" in engine.concept_graph.concepts["graph"].related_concepts
+        assert "memory" not in engine.concept_graph.concepts["graph"].related_concepts
+
+    def test_find_occurrences_returns_every_offset(self, engine):
+        assert engine._find_occurrences("memo", "memo memory memo") == [0, 5, 12]
+
     def test_synthesize_empty(self, engine):
         result = engine.synthesize()
         assert "No conversations" in result
@@ -173,6 +233,32 @@ def test_synthesize_with_conversations(self, engine):
         assert "Synthesis" in result
         assert "Key Themes" in result
 
+    def test_synthesize_cached_until_new_conversation(self, engine, monkeypatch):
+        engine.add_conversation("The memory system stores knowledge")
+        first = engine.synthesize()
+
+        def _fail(*_args):
+            raise AssertionError("synthesis should be served from cache")
+
+        monkeypatch.setattr(engine, "_build_narrative", _fail)
+        assert engine.synthesize() == first
+        monkeypatch.undo()
+
+        engine.add_conversation("Vector embeddings power semantic recall")
+        assert engine.synthesize() != first
+
+    def test_synthesize_sees_direct_graph_changes(self, engine):
+        engine.add_conversation("The memory system stores knowledge")
+        first = engine.synthesize()
+        assert "alpha" not in first
+
+        for _ in range(3):
+            engine.concept_graph.add_concept("alpha", 0)
+        assert "alpha" in engine.synthesize()
+
+        engine.concept_graph = ConceptGraph()
+        assert "memory" not in engine.synthesize()
+
     def test_synthesize_with_focus(self, engine):
         engine.add_conversation("The memory system stores knowledge persistently")
         result = engine.synthesize(focus="memory")
@@ -194,8 +280,8 @@ def test_build_narrative_with_concepts(self, engine):
         assert "agents" in narrative
 
     def test_build_narrative_with_clusters(self, engine):
-        engine.concept_graph.add_concept("alpha", "ctx")
-        engine.concept_graph.add_concept("beta", "ctx")
+        engine.concept_graph.add_concept("alpha", 0)
+        engine.concept_graph.add_concept("beta", 0)
         clusters = [{"alpha", "beta"}]
         nodes = [engine.concept_graph.concepts["alpha"]]
         narrative = engine._build_narrative(nodes, clusters)
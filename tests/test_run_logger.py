@@ -0,0 +1,280 @@
+"""Tests for the RunLogger audit trail."""
+
+import builtins
+import json
+import sqlite3
+import struct
+from datetime import datetime
+
+import pytest
+
+from utils.run_logger import RunLogger
+
+
+@pytest.fixture
+def run_logger(tmp_path):
+    return RunLogger(
+        log_dir=str(tmp_path / "logs"),
+        db_path=str(tmp_path / "data" / "run_logs.db"),
+        run_id="test_run",
+    )
+
+
+def _event_types(db_path, run_id="test_run"):
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT event_type FROM event_log WHERE run_id = ? ORDER BY id", (run_id,)
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def test_log_event_writes_db_and_markdown(run_logger):
+    run_logger.log_event("task_start", "orchestrator", {"task_id": "t1"}, "Starting")
+    run_logger.flush()
+
+    assert _event_types(run_logger.db_path) == ["run_start", "task_start"]
+    md = run_logger.md_path.read_text(encoding="utf-8")
+    assert "| orchestrator | task_start | Starting (task_id=t1) |" in md
+
+
+def test_enabled_for_filters_disabled_event_types(tmp_path):
+    logger = RunLogger(
+        log_dir=str(tmp_path / "logs"),
+        db_path=str(tmp_path / "run_logs.db"),
+        run_id="test_run",
+        disabled_events=["orchestrator_ready"],
+    )
+
+    assert logger.enabled_for("task_start")
+    assert not logger.enabled_for("orchestrator_ready")
+
+    logger.log_event("orchestrator_ready", "main", {"agents": []})
+    logger.log_event("task_start", "orchestrator")
+    logger.flush()
+
+    assert _event_types(logger.db_path) == ["run_start", "task_start"]
+
+
+def test_disabled_logger_records_nothing(tmp_path):
+    logger = RunLogger(
+        log_dir=str(tmp_path / "logs"),
+        db_path=str(tmp_path / "run_logs.db"),
+        run_id="test_run",
+        enabled=False,
+    )
+
+    assert not logger.enabled_for("run_start")
+    logger.log_event("task_start", "orchestrator")
+    logger.flush()
+
+    assert _event_types(logger.db_path) == []
+
+
+def test_metadata_stored_as_compact_json(run_logger):
+    run_logger.log_event("mcp_init", "main", {"agents": 3, "mode": "demo"})
+    run_logger.flush()
+
+    with sqlite3.connect(run_logger.db_path) as conn:
+        (stored,) = conn.execute(
+            "SELECT metadata FROM event_log WHERE event_type = 'mcp_init'"
+        ).fetchone()
+
+    assert stored == '{"agents":3,"mode":"demo"}'
+
+
+def test_events_reuse_one_wal_connection(run_logger, monkeypatch):
+    def _no_connect(*args, **kwargs):
+        raise AssertionError("log calls should reuse the logger's connection")
+
+    monkeypatch.setattr(sqlite3, "connect", _no_connect)
+    run_logger.log_event("task_start", "orchestrator")
+    run_logger.log_db_write("data/x.db", "t", "INSERT", record_id="r1")
+    assert run_logger.get_run_stats()["event_count"] == 2
+    monkeypatch.undo()
+
+    (mode,) = run_logger._conn.execute("PRAGMA journal_mode").fetchone()
+    assert mode == "wal"
+    run_logger.close()
+    assert _event_types(run_logger.db_path) == ["run_start", "task_start"]
+
+
+def test_rows_are_written_in_batches(tmp_path):
+    logger = RunLogger(
+        log_dir=str(tmp_path / "logs"),
+        db_path=str(tmp_path / "run_logs.db"),
+        run_id="test_run",
+        batch_size=3,
+    )
+
+    logger.log_event("task_start", "orchestrator")
+    # run_start + task_start are still buffered
+    assert _event_types(logger.db_path) == []
+
+    logger.log_event("task_end", "orchestrator")
+    assert _event_types(logger.db_path) == ["run_start", "task_start", "task_end"]
+
+    logger.log_vector_operation("doc1", "upsert", "content", [0.1, 0.2])
+    with sqlite3.connect(logger.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM vector_log").fetchone()[0] == 0
+    assert logger.get_run_stats()["vector_operations"] == 1
+
+
+def test_run_stats_count_only_this_run(tmp_path):
+    db_path = str(tmp_path / "run_logs.db")
+    other = RunLogger(log_dir=str(tmp_path / "logs"), db_path=db_path, run_id="other")
+    other.log_db_write("x.db", "t", "INSERT")
+    other.flush()
+
+    logger = RunLogger(log_dir=str(tmp_path / "logs"), db_path=db_path, run_id="mine")
+    logger.log_vector_operation("doc1", "upsert", "content", [0.1, 0.2])
+
+    assert logger.get_run_stats() == {
+        "run_id": "mine",
+        "event_count": 1,
+        "vector_operations": 1,
+        "db_writes": 0,
+    }
+
+
+@pytest.mark.parametrize("log_samples", [True, False])
+def test_embedding_sample_packed_as_floats(tmp_path, log_samples):
+    logger = RunLogger(
+        log_dir=str(tmp_path / "logs"),
+        db_path=str(tmp_path / "run_logs.db"),
+        run_id="test_run",
+        log_embedding_samples=log_samples,
+    )
+    embedding = [float(i) for i in range(16)]
+    logger.log_vector_operation("doc1", "upsert", "content", embedding)
+    logger.flush()
+
+    with sqlite3.connect(logger.db_path) as conn:
+        dim, sample = conn.execute(
+            "SELECT embedding_dim, embedding_sample FROM vector_log"
+        ).fetchone()
+    assert dim == 16
+    if log_samples:
+        assert struct.unpack("<10f", sample) == (0, 1, 2, 3, 4, 11, 12, 13, 14, 15)
+    else:
+        assert sample is None
+
+
+def test_markdown_written_through_one_handle(run_logger, monkeypatch):
+    def _no_open(*args, **kwargs):
+        raise AssertionError("markdown rows should reuse the open log file")
+
+    monkeypatch.setattr(builtins, "open", _no_open)
+    for i in range(3):
+        run_logger.log_event("task_start", "orchestrator", message=f"task {i}")
+    run_logger.finalize_run()
+    monkeypatch.undo()
+
+    md = run_logger.md_path.read_text(encoding="utf-8")
+    assert "| orchestrator | task_start | task 2 |" in md
+    assert "## Run Summary" in md
+    assert "| **Total Events** | 5 |" in md
+
+
+@pytest.mark.parametrize("verbose, mirrored", [(False, []), (True, ["db_write"])])
+def test_hebbian_update_mirrors_db_write_only_when_verbose(tmp_path, verbose, mirrored):
+    logger = RunLogger(
+        log_dir=str(tmp_path / "logs"),
+        db_path=str(tmp_path / "run_logs.db"),
+        run_id="test_run",
+        verbose_events=verbose,
+    )
+
+    logger.log_hebbian_update("agent", "task", "strengthen", 0.0, 1.0)
+
+    stats = logger.get_run_stats()
+    assert stats["db_writes"] == 1
+    expected = ["run_start", "hebbian_strengthen"] + mirrored
+    assert _event_types(logger.db_path) == expected
+
+
+def test_event_timestamp_matches_created_at(run_logger):
+    run_logger.log_event("task_start", "orchestrator")
+    run_logger.log_event("task_end", "orchestrator")
+    run_logger.flush()
+
+    with sqlite3.connect(run_logger.db_path) as conn:
+        rows = conn.execute("SELECT timestamp, created_at FROM event_log").fetchall()
+
+    for timestamp, created_at in rows:
+        parsed = datetime.fromisoformat(timestamp)
+        assert abs(parsed.timestamp() - created_at) < 1e-5
+        assert len(timestamp.split("T")[1]) == len("HH:MM:SS.ffffff")
+
+
+def test_legacy_autoincrement_tables_are_migrated(tmp_path):
+    db_path = str(tmp_path / "run_logs.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript("""
+            CREATE TABLE event_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL, timestamp TEXT NOT NULL,
+                event_type TEXT NOT NULL, component TEXT NOT NULL,
+                message TEXT, metadata TEXT, duration_ms REAL,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX idx_event_run ON event_log(run_id);
+            INSERT INTO event_log
+                (run_id, timestamp, event_type, component, created_at)
+            VALUES ('old_run', '2024-01-01T00:00:00', 'run_start', 'system', 1.0);
+        """)
+
+    logger = RunLogger(
+        log_dir=str(tmp_path / "logs"), db_path=db_path, run_id="test_run"
+    )
+    logger.flush()
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+        schemas = [row[0] for row in conn.execute("SELECT sql FROM sqlite_master")]
+        assert not any("AUTOINCREMENT" in (sql or "") for sql in schemas)
+        indexes = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        assert "idx_event_run" not in indexes
+        assert "idx_event_run_ts" in indexes
+        plan_rows = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM event_log"
+            " WHERE run_id = ? ORDER BY created_at DESC LIMIT 10",
+            ("old_run",),
+        )
+        plan = " ".join(row[-1] for row in plan_rows)
+    assert "idx_event_run_ts" in plan
+    assert "TEMP B-TREE" not in plan
+    assert _event_types(db_path, "old_run") == ["run_start"]
+    assert _event_types(db_path) == ["run_start"]
+
+
+def test_run_end_reports_events_logged_by_this_run(run_logger):
+    for i in range(4):
+        run_logger.log_event("task_start", "orchestrator", {"i": i})
+    run_logger.finalize_run()
+
+    with sqlite3.connect(run_logger.db_path) as conn:
+        (metadata,) = conn.execute(
+            "SELECT metadata FROM event_log WHERE event_type = 'run_end'"
+        ).fetchone()
+
+    assert json.loads(metadata)["total_events"] == 5
+
+
+def test_db_write_preview_and_non_str_keys_serialized(run_logger):
+    run_logger.log_event("scores", "registry", {1: "first"})
+    run_logger.log_db_write("x.db", "t", "INSERT", data={"weight": 1.5, "op": "add"})
+    run_logger.flush()
+
+    with sqlite3.connect(run_logger.db_path) as conn:
+        (metadata,) = conn.execute(
+            "SELECT metadata FROM event_log WHERE event_type = 'scores'"
+        ).fetchone()
+        (preview,) = conn.execute("SELECT data_preview FROM db_write_log").fetchone()
+
+    assert metadata == '{"1":"first"}'
+    assert preview == '{"weight":1.5,"op":"add"}'
@@ -1,3 +1,6 @@
+import json
+import sqlite3
+
 import pytest
 
 from src.mcp.vector_store import LocalVectorStore
@@ -47,3 +50,108 @@ def test_query_can_include_content(vector_store):
     assert doc_id == "doc1"
     assert "path" in metadata
     assert "embedded content" in content
+
+
+def test_upsert_many_streams_records_and_returns_count(vector_store):
+    def records():
+        yield "doc1", "hello world", {"type": "greeting"}
+        yield "doc2", "hello mars", None
+
+    assert vector_store.upsert_many(records()) == 2
+    assert vector_store.count() == 2
+
+
+def test_upsert_if_changed_skips_identical_content(vector_store):
+    assert vector_store.upsert_if_changed("doc1", "hello world", {"type": "greeting"})
+    assert not vector_store.upsert_if_changed(
+        "doc1", "hello world", {"type": "greeting"}
+    )
+    assert vector_store.upsert_if_changed("doc1", "hello mars", {"type": "greeting"})
+
+    metadata = vector_store.get_metadata("doc1")
+    assert metadata["type"] == "greeting"
+    assert "content_hash" in metadata
+    assert vector_store.get_metadata("missing") is None
+
+
+def test_upsert_many_skip_unchanged_counts_only_writes(vector_store):
+    records = [("doc1", "hello world", None), ("doc2", "hello mars", None)]
+
+    assert vector_store.upsert_many(records, skip_unchanged=True) == 2
+    assert vector_store.upsert_many(records, skip_unchanged=True) == 0
+    assert vector_store.count() == 2
+
+
+def test_upsert_many_parallel_matches_sequential(tmp_path):
+    records = [(f"doc{i}", f"content number {i}", {"i": i}) for i in range(5)]
+    sequential = LocalVectorStore(
+        db_path=str(tmp_path / "seq.db"), embedding_fn=simple_embedding
+    )
+    parallel = LocalVectorStore(
+        db_path=str(tmp_path / "par.db"), embedding_fn=simple_embedding
+    )
+
+    assert sequential.upsert_many(records) == 5
+    assert parallel.upsert_many(records, max_workers=3) == 5
+    assert parallel.upsert_many(records, skip_unchanged=True, max_workers=3) == 5
+    assert parallel.upsert_many(records, skip_unchanged=True, max_workers=3) == 0
+
+    seq_rows = {r.doc_id: r.embedding for r in sequential.fetch_all()}
+    par_rows = {r.doc_id: r.embedding for r in parallel.fetch_all()}
+    assert seq_rows == par_rows
+
+
+def test_embeddings_stored_as_packed_floats(vector_store):
+    vector_store.upsert("doc1", "hello world")
+    with sqlite3.connect(vector_store.db_path) as conn:
+        (stored,) = conn.execute(
+            "SELECT embedding FROM vectors WHERE doc_id = 'doc1'"
+        ).fetchone()
+
+    assert isinstance(stored, bytes)
+    (record,) = vector_store.fetch_all()
+    assert record.embedding == vector_store.embedding_fn("hello world")
+
+
+def test_legacy_json_embeddings_still_readable(vector_store):
+    embedding = vector_store.embedding_fn("legacy doc")
+    with sqlite3.connect(vector_store.db_path) as conn:
+        conn.execute(
+            "INSERT INTO vectors (doc_id, embedding, metadata, content) VALUES (?, ?, ?, ?)",
+            ("legacy", json.dumps(embedding), "{}", "legacy doc"),
+        )
+
+    results = vector_store.query("legacy doc", top_k=1)
+    assert results[0][0] == "legacy"
+    assert results[0][1] == pytest.approx(1.0)
+
+
+def test_query_loads_metadata_for_top_k_only(vector_store):
+    for idx in range(6):
+        vector_store.upsert(f"doc{idx}", "x" * (idx + 1), {"idx": idx})
+
+    results = vector_store.query("xxxxxx", top_k=2)
+
+    assert len(results) == 2
+    assert results[0][0] == "doc5"
+    for doc_id, _, metadata in results:
+        assert metadata == vector_store.get_metadata(doc_id)
+
+
+def test_staged_document_written_only_on_commit(vector_store):
+    vector_store.stage("doc1", "staged content", {"tag": "x"})
+    assert vector_store.count() == 0
+    assert vector_store.commit("doc1") is True
+    assert vector_store.count() == 1
+    assert vector_store.get_metadata("doc1") == {"tag": "x"}
+    # Already committed; nothing left to write
+    assert vector_store.commit("doc1") is False
+
+
+def test_discard_drops_staged_document(vector_store):
+    vector_store.upsert("doc1", "original", {"v": 1})
+    vector_store.stage("doc1", "replacement", {"v": 2})
+    assert vector_store.discard("doc1") is True
+    assert vector_store.discard("doc1") is False
+    assert vector_store.commit("doc1") is False
+    assert vector_store.get_metadata("doc1") == {"v": 1}
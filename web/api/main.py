@@ -924,9 +924,8 @@ async def execute_instruction(
         # Create task in Obsidian
         note_path = None
         try:
-            note_path = orchestrator.create_new_task_in_obsidian(task_data)
-            orchestrator.update_task_status_in_obsidian(
-                note_path, "in progress", task_id
+            note_path = orchestrator.create_new_task_in_obsidian(
+                task_data, initial_status="in progress"
             )
         except Exception as e:
             logger.error("Failed to create task in Obsidian: %s", _sanitize_for_log(e))